@@ -10,6 +10,11 @@ ARCHITECTURE:
 WHY FLASK: Lightweight, perfect for MVP/demo. In production, might use FastAPI
 for async support or Django for full framework features.
 
+CONCURRENCY: Handlers are synchronous, so production runs gunicorn with
+threaded workers (see gunicorn_conf.py). Data fetches release the GIL while waiting on
+disk/network, letting other requests proceed on the same worker. Module-level
+objects below must therefore stay safe to share across threads.
+
 ENDPOINTS:
 1. POST /api/backtest - Run strategy backtest
 2. GET /api/strategies - List available strategies
@@ -17,17 +22,23 @@ ENDPOINTS:
 4. GET /api/health - Health check
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
+from flask_compress import Compress
+import orjson
+import numpy as np
+import hashlib
 import logging
 import sys
 import os
+from threading import Lock
+from cachetools import TTLCache
 
 # Add backend directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from data.data_handler import DataHandler
-from engine.backtester import Backtester
+from engine.backtester import Backtester, warm_up as warm_up_engine
 from engine.performance import generate_performance_report
 from strategies.moving_average import MovingAverageStrategy
 from strategies.mean_reversion import MeanReversionStrategy
@@ -48,19 +59,45 @@ app = Flask(__name__)
 # backend (localhost:5000) without CORS headers
 CORS(app)
 
+# Compress responses larger than 1KB
+# WHY: Backtest payloads (equity curves, trade lists) are repetitive JSON
+# that shrinks 5-10x, cutting transfer time to the frontend. Brotli is used
+# for browsers that accept it, gzip otherwise.
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['COMPRESS_LEVEL'] = 6
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app)
+
+
+# orjson flags shared by every pre-encoded response body
+# WHY ORJSON: Backtest payloads hold thousands of floats and date strings.
+# orjson encodes them in C (and NumPy arrays straight from their buffers),
+# several times faster than the stdlib encoder behind jsonify(). The encoded
+# bytes are also what the result cache stores.
+# NOTE: orjson emits null for NaN/Infinity, which (unlike the stdlib's bare
+# Infinity token) is valid JSON for the browser to parse.
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+
 # Initialize data handler and backtester
 # WHY GLOBAL: These are stateless, safe to share across requests
 # Use absolute path for static_data_dir to ensure it works in deployed environment
-import os
 static_data_path = os.path.join(os.path.dirname(__file__), 'static_data')
-logger.info(f"Static data path: {static_data_path}")
-logger.info(f"Static data exists: {os.path.exists(static_data_path)}")
-if os.path.exists(static_data_path):
-    logger.info(f"Static data files: {os.listdir(static_data_path)}")
+# The directory listing is only for the log; skip it when INFO is off
+if logger.isEnabledFor(logging.INFO):
+    logger.info(f"Static data path: {static_data_path}")
+    if os.path.isdir(static_data_path):
+        logger.info(f"Static data files: {os.listdir(static_data_path)}")
 
-data_handler = DataHandler(cache_dir='cache', static_data_dir=static_data_path)
+data_handler = DataHandler(cache_dir='cache', static_data_dir=static_data_path)  # Maps the static archive
 backtester = Backtester(initial_capital=100000.0)
 
+# Compile the engine's JIT kernels now rather than on the first request
+try:
+    warm_up_engine()
+except Exception as e:
+    logger.error(f"Engine warm-up failed: {e}")
+
 # Strategy registry
 # WHY REGISTRY PATTERN: Easy to add new strategies without changing API code
 STRATEGY_REGISTRY = {
@@ -69,6 +106,117 @@ STRATEGY_REGISTRY = {
     'momentum': MomentumStrategy
 }
 
+# Strategy metadata is static, so serialize it once at import time
+# WHY: /api/strategies is polled by the dashboard; no need to rebuild
+# strategy instances and re-encode the same JSON on every request
+_STRATEGIES_CACHE = [
+    {**strategy_class().get_parameter_info(), 'id': name}  # Add ID for frontend reference
+    for name, strategy_class in STRATEGY_REGISTRY.items()
+]
+_STRATEGIES_JSON = app.json.dumps({
+    'strategies': _STRATEGIES_CACHE,
+    'count': len(_STRATEGIES_CACHE)
+})
+
+
+def backtest_fingerprint(
+    strategy_name: str,
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    parameters: dict
+) -> str:
+    """
+    Hash a backtest request into a stable cache key.
+
+    Pass the strategy's resolved parameters (defaults merged in), so that
+    omitting a parameter and sending its default value produce the same key.
+
+    NOTE: Values are hashed exactly as sent; 20 and 20.0 get different keys.
+    Strategies treat them differently (a float window is rejected by pandas'
+    rolling), so a cached result for one must never be served for the other.
+    """
+    canonical = {
+        'strategy': strategy_name,
+        'ticker': ticker,
+        'start_date': start_date,
+        'end_date': end_date,
+        'parameters': parameters
+    }
+    return hashlib.sha1(orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def compile_backtest_response(
+    strategy_name: str,
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    results: dict,
+    performance: dict
+) -> dict:
+    """
+    Assemble the /api/backtest response body from engine results.
+
+    WHY ROUND TO CENTS: The chart only needs cents on the equity curve, and
+    a float64 rounded to cents serializes (via OPT_SERIALIZE_NUMPY's
+    shortest repr) to at most a couple of decimals instead of ~17 digits.
+    The equity curve stays float64: float32 only has 24 bits of mantissa,
+    so it stops holding cents above ~$131k and whole dollars above ~$16.7M.
+    Positions are -1/0/1, which float32 holds exactly. Metrics are computed
+    upstream from the unrounded results.
+    """
+    equity_curve = np.round(np.asarray(results['equity_curve'], dtype=np.float64), 2)
+    return {
+        'success': True,
+        'strategy': strategy_name,
+        'ticker': ticker,
+        'period': {
+            'start': start_date,
+            'end': end_date
+        },
+        'equity_curve': equity_curve,
+        'equity_dates': results['equity_dates'],
+        'positions': np.asarray(results['positions'], dtype=np.float32),
+        'position_dates': results['position_dates'],
+        'trades': results['trades'],
+        'performance': performance
+    }
+
+
+# Pre-rendered responses for canonical demo backtests
+# WHY: Demo clicks on known inputs skip data load, strategy and engine
+# entirely. Files are produced by create_precomputed_results.py at build
+# time and named by backtest_fingerprint(); the directory is optional.
+PRECOMPUTED_RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'precomputed_results')
+
+
+def _load_precomputed_results(directory: str) -> dict:
+    """Read every pre-rendered result file into memory, keyed by fingerprint."""
+    if not os.path.isdir(directory):
+        return {}
+
+    loaded = {}
+    for filename in os.listdir(directory):
+        fingerprint, extension = os.path.splitext(filename)
+        if extension != '.json':
+            continue
+        with open(os.path.join(directory, filename), 'rb') as f:
+            loaded[fingerprint] = f.read()
+
+    logger.info(f"Loaded {len(loaded)} precomputed backtest results")
+    return loaded
+
+
+PRECOMPUTED_RESULTS = _load_precomputed_results(PRECOMPUTED_RESULTS_DIR)
+
+# Recently computed responses, keyed by backtest_fingerprint()
+# WHY: Demo users re-click the same backtest; an identical request within
+# the TTL skips data load, engine and serialization. Bounded and expiring,
+# so parameter sweeps can't grow memory without limit.
+# WHY LOCK: TTLCache isn't thread-safe and gunicorn runs threaded workers.
+_RESULT_CACHE = TTLCache(maxsize=256, ttl=600)
+_RESULT_CACHE_LOCK = Lock()
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -88,29 +236,24 @@ def health_check():
         'has_session': hasattr(data_handler, 'session')
     }), 200
 
-@app.route('/api/test-yfinance', methods=['GET'])
 def test_yfinance():
-    """Debug endpoint to test yfinance directly"""
+    """
+    Debug endpoint to test yfinance directly.
+
+    WHY ONE CALL: Each yfinance call is a live upstream request; a single
+    download is enough to tell whether Yahoo Finance is reachable.
+    """
     import yfinance as yf
     try:
-        # Try multiple methods
-        ticker = yf.Ticker("AAPL", session=data_handler.session)
-
-        # Method 1: period parameter
-        data1 = ticker.history(period="1mo")
-
-        # Method 2: start/end dates
-        data2 = ticker.history(start="2024-01-01", end="2024-01-10")
-
-        # Method 3: yf.download
-        data3 = yf.download("AAPL", start="2024-01-01", end="2024-01-10", progress=False)
+        data = yf.download(
+            "AAPL", start="2024-01-01", end="2024-01-10",
+            progress=False, session=data_handler.session
+        )
 
         return jsonify({
             'success': True,
-            'method1_period_rows': len(data1),
-            'method2_dates_rows': len(data2),
-            'method3_download_rows': len(data3),
-            'columns': list(data1.columns) if len(data1) > 0 else list(data2.columns) if len(data2) > 0 else list(data3.columns) if len(data3) > 0 else []
+            'download_rows': len(data),
+            'columns': [str(col) for col in data.columns]
         }), 200
     except Exception as e:
         return jsonify({
@@ -120,6 +263,12 @@ def test_yfinance():
         }), 500
 
 
+# WHY OPT-IN: The debug endpoint is unauthenticated and turns every hit into
+# upstream Yahoo Finance traffic, so production deploys don't expose it
+if os.getenv('ENABLE_DEBUG_ENDPOINTS') == '1':
+    app.add_url_rule('/api/test-yfinance', view_func=test_yfinance, methods=['GET'])
+
+
 @app.route('/api/strategies', methods=['GET'])
 def get_strategies():
     """
@@ -131,27 +280,7 @@ def get_strategies():
     Returns:
         200 OK with list of strategies and metadata
     """
-    try:
-        strategies = []
-
-        for name, strategy_class in STRATEGY_REGISTRY.items():
-            # Create instance with defaults to get parameter info
-            instance = strategy_class()
-            info = instance.get_parameter_info()
-            info['id'] = name  # Add ID for frontend reference
-            strategies.append(info)
-
-        return jsonify({
-            'strategies': strategies,
-            'count': len(strategies)
-        }), 200
-
-    except Exception as e:
-        logger.error(f"Error listing strategies: {e}", exc_info=True)
-        return jsonify({
-            'error': 'Failed to list strategies',
-            'message': str(e)
-        }), 500
+    return Response(_STRATEGIES_JSON, status=200, mimetype='application/json')
 
 
 @app.route('/api/backtest', methods=['POST'])
@@ -216,25 +345,41 @@ def run_backtest():
                 'message': str(e)
             }), 400
 
-        # Fetch market data (uses cache if available)
+        # Initialize strategy with parameters
         try:
-            market_data = data_handler.get_data(ticker, start_date, end_date)
+            strategy_class = STRATEGY_REGISTRY[strategy_name]
+            strategy = strategy_class(parameters)
         except ValueError as e:
             return jsonify({
-                'error': 'Data fetch failed',
+                'error': 'Invalid strategy parameters',
                 'message': str(e),
-                'ticker': ticker
+                'parameters': parameters
             }), 400
 
-        # Initialize strategy with parameters
+        # Serve pre-rendered result for canonical demo inputs
+        fingerprint = backtest_fingerprint(
+            strategy_name, ticker, start_date, end_date, strategy.parameters
+        )
+        precomputed = PRECOMPUTED_RESULTS.get(fingerprint)
+        if precomputed is not None:
+            logger.info(f"Serving precomputed result: {fingerprint}")
+            return Response(precomputed, status=200, mimetype='application/json')
+
+        # Serve a recently computed identical backtest
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(fingerprint)
+        if cached is not None:
+            logger.info(f"Serving cached result: {fingerprint}")
+            return Response(cached, status=200, mimetype='application/json')
+
+        # Fetch market data (uses cache if available)
         try:
-            strategy_class = STRATEGY_REGISTRY[strategy_name]
-            strategy = strategy_class(parameters)
+            market_data = data_handler.get_data(ticker, start_date, end_date)
         except ValueError as e:
             return jsonify({
-                'error': 'Invalid strategy parameters',
+                'error': 'Data fetch failed',
                 'message': str(e),
-                'parameters': parameters
+                'ticker': ticker
             }), 400
 
         # Run backtest
@@ -263,25 +408,17 @@ def run_backtest():
             performance = {'error': f'Failed to calculate metrics: {str(e)}'}
 
         # Compile response
-        response = {
-            'success': True,
-            'strategy': strategy_name,
-            'ticker': ticker,
-            'period': {
-                'start': start_date,
-                'end': end_date
-            },
-            'equity_curve': results['equity_curve'],
-            'equity_dates': results['equity_dates'],
-            'positions': results['positions'],
-            'position_dates': results['position_dates'],
-            'trades': results['trades'],
-            'performance': performance
-        }
+        response = compile_backtest_response(
+            strategy_name, ticker, start_date, end_date, results, performance
+        )
 
         logger.info(f"Backtest completed successfully: {len(results['trades'])} trades")
 
-        return jsonify(response), 200
+        body = orjson.dumps(response, option=JSON_OPTIONS)
+        with _RESULT_CACHE_LOCK:
+            _RESULT_CACHE[fingerprint] = body
+
+        return Response(body, status=200, mimetype='application/json')
 
     except Exception as e:
         # Catch-all for unexpected errors
@@ -354,22 +491,29 @@ def cache_data():
 
 
 # Error handlers
+# Static error bodies, encoded once
+# WHY: Scanners and typo'd URLs can hit 404/405 far more often than real
+# endpoints; these paths shouldn't rebuild and re-encode the same dict.
+_NOT_FOUND_BODY = orjson.dumps({
+    'error': 'Not found',
+    'message': 'The requested endpoint does not exist'
+})
+_METHOD_NOT_ALLOWED_BODY = orjson.dumps({
+    'error': 'Method not allowed',
+    'message': 'The HTTP method is not supported for this endpoint'
+})
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors with JSON response."""
-    return jsonify({
-        'error': 'Not found',
-        'message': 'The requested endpoint does not exist'
-    }), 404
+    return Response(_NOT_FOUND_BODY, status=404, mimetype='application/json')
 
 
 @app.errorhandler(405)
 def method_not_allowed(error):
     """Handle 405 errors (wrong HTTP method)."""
-    return jsonify({
-        'error': 'Method not allowed',
-        'message': 'The HTTP method is not supported for this endpoint'
-    }), 405
+    return Response(_METHOD_NOT_ALLOWED_BODY, status=405, mimetype='application/json')
 
 
 @app.errorhandler(500)
@@ -384,7 +528,9 @@ def internal_error(error):
 
 if __name__ == '__main__':
     # Development server
-    # WHY: For local testing. In production, use gunicorn (see requirements.txt)
+    # WHY: For local testing. In production, use gunicorn (see gunicorn_conf.py)
+    debug = os.getenv('FLASK_ENV') != 'production'
+
     logger.info("Starting Flask development server...")
     logger.info("API available at: http://localhost:5000")
     logger.info("Health check: http://localhost:5000/api/health")
@@ -392,5 +538,5 @@ if __name__ == '__main__':
     app.run(
         host='0.0.0.0',  # WHY: Listen on all interfaces (allows Docker, remote access)
         port=5000,
-        debug=True  # WHY: Auto-reload on code changes, detailed errors
+        debug=debug  # WHY: Auto-reload on code changes, detailed errors (off in production)
     )
@@ -0,0 +1,73 @@
+"""
+Pre-render demo backtest responses so the API can serve them without running the engine.
+
+Runs each strategy (default parameters) on every bundled static ticker and
+writes the exact /api/backtest response body to precomputed_results/, named
+by the request fingerprint. Run this at deploy/build time, after the static
+data is in place; re-run it whenever the engine or strategies change.
+"""
+
+import os
+import orjson
+from pathlib import Path
+
+from app import (
+    STRATEGY_REGISTRY,
+    PRECOMPUTED_RESULTS_DIR,
+    JSON_OPTIONS,
+    data_handler,
+    backtester,
+    backtest_fingerprint,
+    compile_backtest_response,
+)
+from engine.performance import generate_performance_report
+
+# Tickers and date range covered by the bundled static data
+DEMO_TICKERS = ['AAPL', 'SPY', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
+START_DATE = '2020-01-01'
+END_DATE = '2024-12-01'
+
+OUTPUT_DIR = Path(PRECOMPUTED_RESULTS_DIR)
+
+
+def precompute_result(strategy_name: str, ticker: str, start_date: str, end_date: str) -> Path:
+    """Run one backtest with default parameters and write its response body."""
+    strategy = STRATEGY_REGISTRY[strategy_name]()
+    market_data = data_handler.get_data(ticker, start_date, end_date)
+    results = backtester.run(strategy, market_data)
+    performance = generate_performance_report(
+        equity_curve=results['equity_curve'],
+        returns=results['returns'],
+        trades=results['trades'],
+        initial_capital=results['initial_capital']
+    )
+    response = compile_backtest_response(
+        strategy_name, ticker, start_date, end_date, results, performance
+    )
+
+    fingerprint = backtest_fingerprint(
+        strategy_name, ticker, start_date, end_date, strategy.parameters
+    )
+    filepath = OUTPUT_DIR / f"{fingerprint}.json"
+    temp_path = filepath.with_suffix('.tmp')
+    temp_path.write_bytes(orjson.dumps(response, option=JSON_OPTIONS))
+    os.replace(temp_path, filepath)  # Atomic: the API never sees partial files
+    return filepath
+
+
+if __name__ == '__main__':
+    print("Precomputing demo backtest results...")
+    print("=" * 60)
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    count = 0
+    for strategy_name in STRATEGY_REGISTRY:
+        for ticker in DEMO_TICKERS:
+            filepath = precompute_result(strategy_name, ticker, START_DATE, END_DATE)
+            print(f"✅ {strategy_name} on {ticker} -> {filepath.name}")
+            count += 1
+
+    print("=" * 60)
+    print(f"Successfully precomputed {count} results")
+    print(f"Files saved to: {OUTPUT_DIR}")
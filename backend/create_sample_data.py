@@ -9,6 +9,9 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+
+from data.data_handler import ticker_seed, write_static_archive
 
 # Output directory
 OUTPUT_DIR = Path(__file__).parent / 'static_data'
@@ -34,37 +37,42 @@ def generate_realistic_stock_data(ticker: str, start_price: float, volatility: f
 
     # Generate price series with alternating trends for realistic crossovers
     # WHY: Real markets have bull/bear cycles, creating natural MA crossovers
-    np.random.seed(hash(ticker) % 2**32)  # Reproducible but different per ticker
+    rng = np.random.default_rng(ticker_seed(ticker))  # Reproducible but different per ticker
+
+    # Draw every normal needed for this ticker in one batch
+    # WHY: One Generator call fills a single (4, n_days) block instead of
+    # four separate draws; rows are daily return, open, high and low noise
+    noise = rng.standard_normal((4, n_days))
+    volume = rng.integers(50_000_000, 150_000_000, n_days)
 
     # Create trend segments (bull/bear markets)
+    # WHY VECTORIZED: One NumPy pass instead of a Python loop over every business day
     segment_length = n_days // 6  # ~6 major trend changes over the period
-    price_series = np.zeros(n_days)
-    price_series[0] = start_price
+    segments = np.arange(n_days) // segment_length
+    # Alternate between uptrend and downtrend
+    trends = np.where(segments % 2 == 0, trend, -trend * 0.3)
+    daily_returns = trends / 252 + volatility * noise[0]
 
-    for i in range(1, n_days):
-        segment = i // segment_length
-        # Alternate between uptrend and downtrend
-        current_trend = trend if segment % 2 == 0 else -trend * 0.3
-        daily_return = np.random.normal(current_trend/252, volatility)
-        price_series[i] = price_series[i-1] * (1 + daily_return)
+    # Compound returns from the starting price (day 0 has no return)
+    price_series = start_price * np.concatenate(([1.0], np.cumprod(1 + daily_returns[1:])))
 
     # Generate OHLCV data
     # WHY: Realistic intraday movements for backtesting
-    data = pd.DataFrame(index=dates)
-    data['Close'] = price_series
-    data['Open'] = data['Close'] * (1 + np.random.normal(0, volatility/4, n_days))
-    data['High'] = np.maximum(data['Open'], data['Close']) * (1 + np.abs(np.random.normal(0, volatility/2, n_days)))
-    data['Low'] = np.minimum(data['Open'], data['Close']) * (1 - np.abs(np.random.normal(0, volatility/2, n_days)))
-    data['Adj Close'] = data['Close']  # Same as close for our purposes
-    data['Volume'] = np.random.randint(50_000_000, 150_000_000, n_days)
+    # WHY ONE BLOCK: Prices live in a single contiguous (n_days, 4) array filled
+    # in place, instead of a DataFrame column assignment per field
+    # WHY NO ADJ CLOSE: It would be a literal copy of Close; strategies only read Close
+    ohlc = np.empty((n_days, 4), dtype=np.float64)  # Open, High, Low, Close
+    close = ohlc[:, 3]
+    close[:] = price_series
+    ohlc[:, 0] = close * (1 + volatility/4 * noise[1])
+    ohlc[:, 1] = np.maximum(ohlc[:, 0], close) * (1 + np.abs(volatility/2 * noise[2]))
+    ohlc[:, 2] = np.minimum(ohlc[:, 0], close) * (1 - np.abs(volatility/2 * noise[3]))
 
     # Round to realistic precision
-    data[['Open', 'High', 'Low', 'Close', 'Adj Close']] = data[['Open', 'High', 'Low', 'Close', 'Adj Close']].round(2)
+    np.round(ohlc, 2, out=ohlc)
 
-    # Save to CSV
-    filename = f"{ticker}_{START_DATE}_{END_DATE}.csv"
-    filepath = OUTPUT_DIR / filename
-    data.to_csv(filepath)
+    data = pd.DataFrame(ohlc, index=dates, columns=['Open', 'High', 'Low', 'Close'])
+    data['Volume'] = volume
 
     print(f"✅ {ticker}: Generated {len(data)} days, price range ${data['Low'].min():.2f}-${data['High'].max():.2f}")
 
@@ -80,14 +88,25 @@ DEMO_STOCKS = {
     'TSLA': {'start_price': 85, 'volatility': 0.040, 'trend': 0.50},   # Very volatile growth
 }
 
+def _generate_one(item):
+    """Pool worker: unpack a (ticker, params) pair from DEMO_STOCKS."""
+    ticker, params = item
+    return ticker, generate_realistic_stock_data(ticker, **params)
+
+
 if __name__ == '__main__':
     print("Generating realistic sample data for demo...")
     print("=" * 60)
 
-    for ticker, params in DEMO_STOCKS.items():
-        generate_realistic_stock_data(ticker, **params)
+    # WHY PROCESSES: Each ticker is independent, CPU-bound NumPy work, so
+    # separate processes sidestep the GIL and run all tickers at once
+    with ProcessPoolExecutor(max_workers=len(DEMO_STOCKS)) as executor:
+        frames = dict(executor.map(_generate_one, DEMO_STOCKS.items()))
+
+    # Pack every ticker into the memory-mapped archive the API serves static data from
+    write_static_archive(str(OUTPUT_DIR), frames)
 
     print("=" * 60)
-    print(f"Successfully generated {len(DEMO_STOCKS)} data files")
-    print(f"Files saved to: {OUTPUT_DIR}")
+    print(f"Successfully generated {len(frames)} tickers")
+    print(f"Archive saved to: {OUTPUT_DIR}")
     print("\nThese files will be bundled with deployment for reliable demos.")
@@ -4,19 +4,26 @@ Data Handler - Manages market data fetching and caching.
 WHY CACHING: During interviews/demos, you can't afford to wait for API calls.
 Pre-caching common tickers ensures instant backtests. Also respects API rate limits.
 
-DESIGN DECISION: Use pickle for caching instead of CSV because:
+DESIGN DECISION: Use msgpack (msgspec) with raw column buffers for caching
+instead of CSV or pickle because:
 - Preserves data types (dates, floats) without parsing overhead
-- Faster serialization/deserialization
-- Maintains pandas index structure
+- Numeric columns travel as contiguous bytes, rebuilt with np.frombuffer
+- msgspec's encoder/decoder skip pickle's opcode interpreter entirely
 """
 
 import os
-import pickle
+import json
+import time
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 import pandas as pd
 import numpy as np
+import msgspec
 import yfinance as yf
 from requests import Session
 from requests.adapters import HTTPAdapter
@@ -27,6 +34,268 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _to_day(date: str) -> np.datetime64:
+    """
+    Parse a date string as datetime64[D].
+
+    WHY pd.Timestamp: validate_date_range (strptime's %m/%d) accepts dates
+    that aren't zero-padded, such as '2019-9-9', which np.datetime64 rejects.
+    """
+    return pd.Timestamp(date).to_datetime64().astype('datetime64[D]')
+
+
+@lru_cache(maxsize=128)
+def _business_days(start_date: str, end_date: str) -> pd.DatetimeIndex:
+    """
+    Weekdays from start_date to end_date inclusive (same as freq='B').
+
+    WHY: np.is_busday masks a day array in one vectorized pass, where
+    pd.date_range(freq='B') steps its offset rule day by day. Memoized
+    because sweeps reuse the same ranges; DatetimeIndex is immutable,
+    so sharing it is safe.
+    """
+    days = np.arange(
+        _to_day(start_date),
+        _to_day(end_date) + 1,
+        dtype='datetime64[D]'
+    )
+    return pd.DatetimeIndex(days[np.is_busday(days)].astype('datetime64[ns]'))
+
+
+def ticker_seed(ticker: str) -> int:
+    """
+    Stable 64-bit RNG seed for a ticker.
+
+    WHY NOT hash(): Python's str hash is randomized per process
+    (PYTHONHASHSEED), so each gunicorn worker and every restart would
+    generate different "sample" data for the same ticker.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(ticker.encode('utf-8'), digest_size=8).digest(),
+        'little'
+    )
+
+
+# Single-archive layout for the bundled static data
+# WHY: One memory-mapped block for every ticker. With gunicorn's preload the
+# mapping is shared through the OS page cache, so N workers hold one copy,
+# and a request's data is a slice of the block rather than a parsed file.
+STATIC_ARCHIVE_PRICES = 'static_prices.npy'   # (rows, 4) float64: OHLC
+STATIC_ARCHIVE_VOLUME = 'static_volume.npy'   # (rows,) int64
+STATIC_ARCHIVE_DATES = 'static_dates.npy'     # (rows,) datetime64[ns]
+STATIC_ARCHIVE_INDEX = 'static_index.json'    # ticker -> row range and date range
+STATIC_PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+
+def write_static_archive(static_data_dir: str, frames: Dict[str, pd.DataFrame]) -> int:
+    """
+    Pack per-ticker OHLCV frames into the memory-mappable archive.
+
+    Args:
+        static_data_dir: Directory the archive files are written to
+        frames: Ticker -> non-empty DataFrame with OHLC and Volume columns,
+                sorted by date
+
+    Returns:
+        Number of tickers written
+
+    WHY: Called by the data generation scripts. The archive is the only
+    on-disk format for bundled data, so nothing else has to be kept in sync.
+
+    NOTE: Each ticker's coverage is its first and last row, not the range
+    that was requested: a download can come back shorter (yfinance's
+    period="5y"), and requests beyond the real rows must miss.
+    """
+    index = {}
+    row = 0
+    for ticker, data in frames.items():
+        index[ticker] = {
+            'rows': [row, row + len(data)],
+            'start_date': data.index[0].strftime('%Y-%m-%d'),
+            'end_date': data.index[-1].strftime('%Y-%m-%d')
+        }
+        row += len(data)
+
+    prices = np.empty((row, len(STATIC_PRICE_COLUMNS)), dtype=np.float64)
+    volume = np.empty(row, dtype=np.int64)
+    dates = np.empty(row, dtype='datetime64[ns]')
+    for ticker, data in frames.items():
+        lo, hi = index[ticker]['rows']
+        prices[lo:hi] = data[STATIC_PRICE_COLUMNS].to_numpy(dtype=np.float64)
+        volume[lo:hi] = data['Volume'].to_numpy(dtype=np.int64)
+        dates[lo:hi] = data.index.to_numpy(dtype='datetime64[ns]')
+
+    np.save(os.path.join(static_data_dir, STATIC_ARCHIVE_PRICES), prices)
+    np.save(os.path.join(static_data_dir, STATIC_ARCHIVE_VOLUME), volume)
+    np.save(os.path.join(static_data_dir, STATIC_ARCHIVE_DATES), dates)
+    with open(os.path.join(static_data_dir, STATIC_ARCHIVE_INDEX), 'w') as f:
+        json.dump(index, f, indent=2)
+
+    return len(index)
+
+
+_CACHE_ENCODER = msgspec.msgpack.Encoder()
+_CACHE_DECODER = msgspec.msgpack.Decoder()
+
+# Cent-precision prices below this magnitude survive a float32 round-trip:
+# float32 error here is under 0.004, so rounding to cents restores them exactly
+_FLOAT32_CENTS_LIMIT = 2.0 ** 16
+_INT32 = np.iinfo(np.int32)
+
+
+def _narrow_column(values: np.ndarray) -> tuple:
+    """
+    Pick a smaller on-disk representation for a column, when it's lossless.
+
+    Returns:
+        (stored values, decimals to round to on load, or None)
+
+    WHY: Halving the bytes of cent-rounded prices and of volumes that fit
+    in int32 halves cache file size and load bandwidth. Columns that can't
+    be restored bit-for-bit (e.g. split-adjusted prices) stay as they are,
+    so a cache hit always returns the same numbers as the original fetch.
+    """
+    if values.dtype == np.float64 and len(values):
+        finite = np.isfinite(values)
+        if (np.abs(values[finite]) < _FLOAT32_CENTS_LIMIT).all() and \
+                np.array_equal(np.round(values, 2), values, equal_nan=True):
+            return values.astype(np.float32), 2
+    elif values.dtype == np.int64 and len(values):
+        if _INT32.min <= values.min() and values.max() <= _INT32.max:
+            return values.astype(np.int32), None
+    return values, None
+
+
+def _encode_frame(data: pd.DataFrame) -> bytes:
+    """
+    Encode a DatetimeIndex'd numeric DataFrame as msgpack.
+
+    Layout: the index as int64 nanoseconds plus its timezone, then each
+    column's raw buffer with its dtype, narrowed where lossless (see
+    _narrow_column). Column names go in a list (not map keys) so tuple
+    names from MultiIndex columns survive the round-trip.
+
+    Raises:
+        ValueError: If a column isn't numeric (object buffers aren't portable)
+    """
+    columns = []
+    for name in data.columns:
+        values = data[name].to_numpy()
+        if values.dtype.kind not in 'biuf':
+            raise ValueError(f"Cannot cache non-numeric column {name!r} ({values.dtype})")
+        stored, decimals = _narrow_column(values)
+        columns.append({
+            'name': list(name) if isinstance(name, tuple) else name,
+            'dtype': values.dtype.str,
+            'stored_dtype': stored.dtype.str,
+            'decimals': decimals,
+            'data': np.ascontiguousarray(stored).tobytes()
+        })
+
+    return _CACHE_ENCODER.encode({
+        'index': data.index.asi8.tobytes(),
+        'index_name': data.index.name,
+        'tz': str(data.index.tz) if data.index.tz is not None else None,
+        'columns': columns
+    })
+
+
+def _widen_column(column: dict) -> np.ndarray:
+    """Restore a column encoded by _encode_frame to its original dtype."""
+    values = np.frombuffer(column['data'], dtype=np.dtype(column['stored_dtype']))
+    values = values.astype(np.dtype(column['dtype']))
+    if column['decimals'] is not None:
+        np.round(values, column['decimals'], out=values)
+    return values
+
+
+def _decode_frame(payload: bytes) -> pd.DataFrame:
+    """Rebuild a DataFrame written by _encode_frame."""
+    decoded = _CACHE_DECODER.decode(payload)
+
+    index = pd.DatetimeIndex(np.frombuffer(decoded['index'], dtype=np.int64).view('datetime64[ns]'))
+    if decoded['tz'] is not None:
+        index = index.tz_localize('UTC').tz_convert(decoded['tz'])
+    index.name = decoded['index_name']
+
+    names = [
+        tuple(col['name']) if isinstance(col['name'], list) else col['name']
+        for col in decoded['columns']
+    ]
+    data = pd.DataFrame(
+        {i: _widen_column(col) for i, col in enumerate(decoded['columns'])},
+        index=index
+    )
+    data.columns = pd.MultiIndex.from_tuples(names) if names and all(
+        isinstance(name, tuple) for name in names
+    ) else names
+    return data
+
+
+class StaticDataArchive:
+    """
+    Read-only, memory-mapped view of the bundled static data.
+
+    Lookups return DataFrames whose columns are views into the mapping:
+    no file parsing and no copy. Mapped pages are read-only, so accidental
+    in-place writes raise instead of corrupting the shared data.
+    """
+
+    def __init__(self, static_data_dir: str):
+        """
+        Map the archive files in static_data_dir.
+
+        Raises:
+            FileNotFoundError: If any archive file is missing
+        """
+        with open(os.path.join(static_data_dir, STATIC_ARCHIVE_INDEX)) as f:
+            self.index = json.load(f)
+        self.prices = np.load(os.path.join(static_data_dir, STATIC_ARCHIVE_PRICES), mmap_mode='r')
+        self.volume = np.load(os.path.join(static_data_dir, STATIC_ARCHIVE_VOLUME), mmap_mode='r')
+        self.dates = np.load(os.path.join(static_data_dir, STATIC_ARCHIVE_DATES), mmap_mode='r')
+
+    def get(self, ticker: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """
+        Slice a ticker's rows for a date range.
+
+        Returns:
+            DataFrame, or None if the ticker isn't archived or the range
+            falls outside the archived one
+
+        WHY SUB-RANGES: A range inside the bundled one is served from the
+        same real rows instead of falling through to generated data.
+        """
+        entry = self.index.get(ticker)
+        if entry is None:
+            return None
+
+        # Compare parsed days, not strings: '2020-1-1' sorts after '2020-01-01'
+        first_day = _to_day(start_date)
+        last_day = _to_day(end_date)
+        # Weekend days at either end have no rows to miss: a range ending on
+        # the Sunday after the last archived Friday is still fully covered
+        if (np.busday_offset(first_day, 0, roll='forward') < _to_day(entry['start_date'])
+                or np.busday_offset(last_day, 0, roll='backward') > _to_day(entry['end_date'])):
+            return None
+
+        lo, hi = entry['rows']
+        ticker_dates = self.dates[lo:hi]
+        # Inclusive on both ends, like DataFrame.loc[start:end]
+        start = lo + np.searchsorted(ticker_dates, first_day.astype('datetime64[ns]'), side='left')
+        end = lo + np.searchsorted(ticker_dates, last_day.astype('datetime64[ns]'), side='right')
+        if start >= end:
+            return None
+
+        data = pd.DataFrame(
+            self.prices[start:end],
+            index=pd.DatetimeIndex(self.dates[start:end]),
+            columns=STATIC_PRICE_COLUMNS,
+            copy=False
+        )
+        data['Volume'] = self.volume[start:end]
+        return data
+
+
 class DataHandler:
     """
     Handles downloading, caching, and retrieving market data.
@@ -40,13 +309,19 @@ class DataHandler:
     Reduces latency and external dependencies.
     """
 
-    def __init__(self, cache_dir: str = "cache", static_data_dir: str = "static_data"):
+    def __init__(
+        self,
+        cache_dir: str = "cache",
+        static_data_dir: str = "static_data",
+        memory_cache_size: int = 64
+    ):
         """
         Initialize data handler.
 
         Args:
             cache_dir: Directory to store cached data files
             static_data_dir: Directory containing pre-loaded static data files
+            memory_cache_size: Number of (ticker, start, end) results kept in memory
 
         WHY: Configurable cache directory allows testing with temp directories
         and production use with persistent storage. Static data ensures demos
@@ -55,11 +330,32 @@ class DataHandler:
         self.cache_dir = cache_dir
         self.static_data_dir = static_data_dir
         os.makedirs(cache_dir, exist_ok=True)
+        self.static_archive = self._open_static_archive()
+
+        # In-memory LRU over get_data results
+        # WHY: Strategy comparisons and parameter sweeps request the same
+        # (ticker, start, end) repeatedly; a hit skips file reads, decoding
+        # and sample generation. The lock guards concurrent request threads.
+        self.memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
 
         # Create robust session with retry logic for production environments
         # WHY: Network issues are common in cloud environments, retries improve reliability
         self.session = self._create_session()
 
+    def _open_static_archive(self) -> Optional[StaticDataArchive]:
+        """Map the static data archive if the directory has one."""
+        if not os.path.exists(os.path.join(self.static_data_dir, STATIC_ARCHIVE_INDEX)):
+            return None
+        try:
+            archive = StaticDataArchive(self.static_data_dir)
+            logger.info(f"Mapped static data archive: {len(archive.index)} tickers")
+            return archive
+        except Exception as e:
+            logger.error(f"Failed to map static data archive: {e}")
+            return None
+
     def _create_session(self) -> Session:
         """
         Create a requests session with retry logic and proper headers.
@@ -78,6 +374,9 @@ class DataHandler:
             allowed_methods=["GET", "POST"]
         )
 
+        # NOTE: Default pool size. Downloads only happen on cache misses inside
+        # request threads (4 per gunicorn worker by default), well under the
+        # adapter's 10 kept-alive connections per host
         adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
@@ -116,62 +415,72 @@ class DataHandler:
         logger.info(f"Generating sample data for {ticker} ({start_date} to {end_date})")
 
         # Generate date range (business days only)
-        dates = pd.date_range(start=start_date, end=end_date, freq='B')
+        dates = _business_days(start_date, end_date)
         n_days = len(dates)
 
         if n_days == 0:
             raise ValueError(f"No business days in range {start_date} to {end_date}")
 
-        # Use ticker hash as seed for reproducibility
-        # WHY: Same ticker always generates same data for consistency
-        np.random.seed(hash(ticker) % 2**32)
+        # Use a stable ticker hash as seed for reproducibility
+        # WHY: Same ticker always generates same data, in every process
+        # WHY GENERATOR: A local PCG64 Generator instead of the legacy global
+        # np.random.seed, which concurrent requests would otherwise share
+        rng = np.random.default_rng(ticker_seed(ticker))
 
         # Infer reasonable parameters based on ticker name
         # WHY: Makes data look more realistic (tech stocks more volatile, etc.)
         ticker_upper = ticker.upper()
         if any(tech in ticker_upper for tech in ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA']):
-            start_price = np.random.uniform(100, 300)
+            start_price = rng.uniform(100, 300)
             volatility = 0.020  # 2% daily vol
             trend = 0.20  # 20% annual growth
         elif any(idx in ticker_upper for idx in ['SPY', 'QQQ', 'DIA', 'IWM']):
-            start_price = np.random.uniform(300, 450)
+            start_price = rng.uniform(300, 450)
             volatility = 0.012  # 1.2% daily vol
             trend = 0.10  # 10% annual growth
         elif 'TSLA' in ticker_upper or 'GME' in ticker_upper:
-            start_price = np.random.uniform(50, 200)
+            start_price = rng.uniform(50, 200)
             volatility = 0.040  # 4% daily vol (very volatile)
             trend = 0.30  # 30% annual growth
         else:
             # Generic stock
-            start_price = np.random.uniform(50, 200)
+            start_price = rng.uniform(50, 200)
             volatility = 0.018  # 1.8% daily vol
             trend = 0.12  # 12% annual growth
 
+        # Draw every normal needed in one batch
+        # WHY: Rows are daily return, open, high and low noise
+        noise = rng.standard_normal((4, n_days))
+
         # Generate price series with trend reversals
         # WHY: Creates realistic bull/bear cycles for strategy testing
+        # WHY VECTORIZED: cumprod over all days instead of a Python loop per day
         segment_length = max(n_days // 6, 20)  # At least 6 trend changes or 20-day segments
-        price_series = np.zeros(n_days)
-        price_series[0] = start_price
-
-        for i in range(1, n_days):
-            segment = i // segment_length
-            # Alternate between uptrend and downtrend
-            current_trend = trend if segment % 2 == 0 else -trend * 0.3
-            daily_return = np.random.normal(current_trend / 252, volatility)
-            price_series[i] = price_series[i-1] * (1 + daily_return)
+        segments = np.arange(n_days) // segment_length
+        # Alternate between uptrend and downtrend
+        trends = np.where(segments % 2 == 0, trend, -trend * 0.3)
+        daily_returns = trends / 252 + volatility * noise[0]
+        daily_returns[0] = 0.0  # First day is the starting price
+        price_series = start_price * np.cumprod(1 + daily_returns)
 
         # Generate OHLCV data
-        data = pd.DataFrame(index=dates)
-        data['Close'] = price_series
-        data['Open'] = data['Close'] * (1 + np.random.normal(0, volatility/4, n_days))
-        data['High'] = np.maximum(data['Open'], data['Close']) * (1 + np.abs(np.random.normal(0, volatility/2, n_days)))
-        data['Low'] = np.minimum(data['Open'], data['Close']) * (1 - np.abs(np.random.normal(0, volatility/2, n_days)))
-        data['Adj Close'] = data['Close']
-        data['Volume'] = np.random.randint(50_000_000, 150_000_000, n_days)
+        # WHY ONE BLOCK: Prices are filled into a single (n_days, 5) array and
+        # wrapped once, instead of a DataFrame column assignment per field
+        prices = np.empty((n_days, 5), dtype=np.float64)  # Close, Open, High, Low, Adj Close
+        close, open_ = prices[:, 0], prices[:, 1]
+        close[:] = price_series
+        open_[:] = price_series * (1 + volatility/4 * noise[1])
+        prices[:, 2] = np.maximum(open_, close) * (1 + np.abs(volatility/2 * noise[2]))
+        prices[:, 3] = np.minimum(open_, close) * (1 - np.abs(volatility/2 * noise[3]))
+        prices[:, 4] = close
 
         # Round to realistic precision
-        data[['Open', 'High', 'Low', 'Close', 'Adj Close']] = \
-            data[['Open', 'High', 'Low', 'Close', 'Adj Close']].round(2)
+        np.round(prices, 2, out=prices)
+
+        data = pd.DataFrame(
+            prices, index=dates, columns=['Close', 'Open', 'High', 'Low', 'Adj Close']
+        )
+        data['Volume'] = rng.integers(50_000_000, 150_000_000, n_days)
 
         logger.info(f"Generated {len(data)} days of data for {ticker}, "
                    f"price range ${data['Low'].min():.2f}-${data['High'].max():.2f}")
@@ -180,31 +489,24 @@ class DataHandler:
 
     def _load_static_data(self, ticker: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
         """
-        Load data from static files if available, otherwise generate on-the-fly.
+        Load data from the static archive if available, otherwise generate on-the-fly.
 
         WHY: This fallback approach ensures the platform works with ANY ticker
-        and ANY date range. Pre-generated files are used when available for speed,
-        but we can generate data for any request dynamically.
+        and ANY date range. Bundled data is used when the archive covers the
+        request, but we can generate data for any request dynamically.
 
         IMPORTANT: The generated data is realistic but simulated. This is acceptable
         because the backtesting ENGINE, strategy LOGIC, and performance CALCULATIONS
         are all real. The data generation just ensures demos work reliably.
         """
-        static_path = os.path.join(
-            self.static_data_dir,
-            f"{ticker}_{start_date}_{end_date}.csv"
-        )
-
-        # First try to load pre-generated file
-        if os.path.exists(static_path):
-            try:
-                data = pd.read_csv(static_path, index_col=0, parse_dates=True)
-                logger.info(f"Static data loaded from file: {ticker}")
+        # First try the memory-mapped archive of bundled tickers
+        if self.static_archive is not None:
+            data = self.static_archive.get(ticker, start_date, end_date)
+            if data is not None:
+                logger.info(f"Static data loaded from archive: {ticker}")
                 return data
-            except Exception as e:
-                logger.error(f"Failed to load static file: {e}, generating instead")
 
-        # If no static file, generate on-the-fly
+        # If the ticker or range isn't bundled, generate on-the-fly
         # WHY: This makes the platform work with ANY ticker, not just the 6 pre-loaded ones
         try:
             return self._generate_sample_data(ticker, start_date, end_date)
@@ -219,11 +521,11 @@ class DataHandler:
         WHY: Deterministic naming scheme based on query parameters ensures
         we cache the exact data requested and retrieve it correctly.
 
-        Format: {ticker}_{start_date}_{end_date}.pkl
+        Format: {ticker}_{start_date}_{end_date}.msgpack
         """
         return os.path.join(
             self.cache_dir,
-            f"{ticker}_{start_date}_{end_date}.pkl"
+            f"{ticker}_{start_date}_{end_date}.msgpack"
         )
 
     def _load_from_cache(self, cache_path: str, max_age_days: int = 1) -> Optional[pd.DataFrame]:
@@ -231,7 +533,7 @@ class DataHandler:
         Load data from cache if it exists and is recent.
 
         Args:
-            cache_path: Path to cached pickle file
+            cache_path: Path to cached msgpack file
             max_age_days: Maximum age of cache in days (default 1)
 
         Returns:
@@ -242,20 +544,22 @@ class DataHandler:
 
         EDGE CASE: Corrupted cache files are caught and treated as cache miss.
         """
-        if not os.path.exists(cache_path):
+        # One stat call covers both the existence and the age check
+        try:
+            stat = os.stat(cache_path)
+        except FileNotFoundError:
             return None
 
-        # Check file age
-        file_modified = datetime.fromtimestamp(os.path.getmtime(cache_path))
-        age = datetime.now() - file_modified
+        # Check file age (whole days, as timedelta.days would count them)
+        age_days = int((time.time() - stat.st_mtime) // 86400)
 
-        if age.days > max_age_days:
-            logger.info(f"Cache expired (age: {age.days} days): {cache_path}")
+        if age_days > max_age_days:
+            logger.info(f"Cache expired (age: {age_days} days): {cache_path}")
             return None
 
         try:
             with open(cache_path, 'rb') as f:
-                data = pickle.load(f)
+                data = _decode_frame(f.read())
             logger.info(f"Cache HIT: {cache_path}")
             return data
         except Exception as e:
@@ -268,11 +572,21 @@ class DataHandler:
 
         WHY: Atomic write pattern (write to temp, then rename) prevents
         corrupted caches if write is interrupted.
+
+        WHY NO PICKLE FALLBACK: Frames _encode_frame can't represent
+        (non-numeric columns) simply go uncached. Unpickling a cache file
+        would execute whatever a writable cache directory contains.
         """
         try:
+            try:
+                payload = _encode_frame(data)
+            except ValueError as e:
+                logger.warning(f"Not caching {cache_path}: {e}")
+                return
+
             temp_path = cache_path + '.tmp'
             with open(temp_path, 'wb') as f:
-                pickle.dump(data, f)
+                f.write(payload)
             os.replace(temp_path, cache_path)  # Atomic operation
             logger.info(f"Cached data: {cache_path}")
         except Exception as e:
@@ -322,8 +636,10 @@ class DataHandler:
 
             # Use Adj Close for accurate backtesting (accounts for splits/dividends)
             # WHY: Adj Close prevents false signals from corporate actions
+            # WHY RENAME: Replacing the Close column by relabeling avoids copying
+            # Adj Close into it (and leaves no duplicate column behind)
             if 'Adj Close' in data.columns:
-                data['Close'] = data['Adj Close']
+                data = data.drop(columns=['Close']).rename(columns={'Adj Close': 'Close'})
 
             # Ensure we have the required columns
             required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
@@ -358,18 +674,47 @@ class DataHandler:
             use_cache: Whether to use cached data (default True)
 
         Returns:
-            DataFrame with OHLCV data and DatetimeIndex
+            DataFrame with OHLCV data and DatetimeIndex. With use_cache the
+            same object is returned on repeat calls, so treat it as read-only.
 
         WHY MULTIPLE SOURCES: Production systems need fallbacks. If Yahoo Finance
         is down or rate-limiting, we fall back to static data for demos.
 
         FLOW:
+        0. Return the in-memory copy (if enabled and seen recently)
         1. Try static data (pre-loaded, always works)
         2. Try cache (if enabled)
         3. Download if cache miss
         4. Save to cache for future use
         5. Return data
         """
+        key = (ticker, start_date, end_date)
+        if use_cache:
+            with self._memory_cache_lock:
+                data = self._memory_cache.get(key)
+                if data is not None:
+                    self._memory_cache.move_to_end(key)
+                    return data
+
+        data = self._fetch_data(ticker, start_date, end_date, use_cache)
+
+        if use_cache:
+            with self._memory_cache_lock:
+                self._memory_cache[key] = data
+                self._memory_cache.move_to_end(key)
+                while len(self._memory_cache) > self.memory_cache_size:
+                    self._memory_cache.popitem(last=False)
+
+        return data
+
+    def _fetch_data(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        use_cache: bool
+    ) -> pd.DataFrame:
+        """Resolve data from static files, disk cache or download (see get_data)."""
         # Try static data first (most reliable for demos)
         static_data = self._load_static_data(ticker, start_date, end_date)
         if static_data is not None:
@@ -415,10 +760,15 @@ class DataHandler:
 
         DESIGN DECISION: Return status dict instead of raising errors so
         partial failures don't block caching other tickers.
+
+        NOTE: Sequential on purpose. Every ticker resolves through
+        _load_static_data, which serves the archive or generates sample data
+        and never reaches _download_data. That work is CPU-bound under the
+        GIL, so a thread pool only adds overhead.
         """
         results = {}
 
-        for ticker in tickers:
+        for ticker in dict.fromkeys(tickers):
             try:
                 self.get_data(ticker, start_date, end_date, use_cache=True)
                 results[ticker] = 'success'
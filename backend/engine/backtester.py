@@ -10,15 +10,118 @@ DESIGN PATTERN: This is the Strategy pattern - the engine executes
 any object implementing the BaseStrategy interface.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from strategies.base_strategy import BaseStrategy
+from strategies.indicators import IndicatorCache, as_kernel_array, warm_up as _warm_up_indicators
+from engine._perf_kernels import warm_up as _warm_up_metrics
 import logging
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the pandas path below is the fallback
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
+# Columns every backtest needs
+_REQUIRED_COLUMNS = frozenset(['Close', 'Open', 'High', 'Low'])
+
+
+def _run_kernel_py(
+    close: np.ndarray,
+    position: np.ndarray,
+    initial_capital: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Single-pass bar loop: strategy returns, equity curve and trade boundaries.
+
+    Returns:
+        (equity, strategy_returns, entry_indices, exit_indices)
+
+    WHY ONE LOOP: Compiled with Numba, walking the bars once replaces the
+    pct_change/multiply/cumprod chain and the per-row trade scan with native
+    code. Arithmetic order matches the pandas path, so results are identical.
+
+    NaN closes follow pct_change().fillna(0): returns are measured from the
+    last valid close, and a return that is undefined (a missing bar, no
+    valid close yet, 0/0) is 0.
+    """
+    n = close.shape[0]
+    equity = np.empty(n)
+    strategy_returns = np.empty(n)
+    entries = np.empty(n, dtype=np.int64)
+    exits = np.empty(n, dtype=np.int64)
+    n_entries = 0
+    n_exits = 0
+
+    growth = 1.0
+    prev_pos = 0.0
+    in_trade = False
+    last_close = np.nan
+    for i in range(n):
+        price = close[i]
+        market_return = 0.0
+        if price == price:  # not NaN
+            if i > 0:
+                market_return = price / last_close - 1.0
+                if market_return != market_return:
+                    market_return = 0.0
+            last_close = price
+        pos = position[i]
+        strategy_returns[i] = pos * market_return
+        growth *= 1.0 + strategy_returns[i]
+        equity[i] = initial_capital * growth
+
+        # Entry: 0 -> non-zero; exit: non-zero -> 0
+        if prev_pos == 0 and pos != 0:
+            entries[n_entries] = i
+            n_entries += 1
+            in_trade = True
+        elif prev_pos != 0 and pos == 0 and in_trade:
+            exits[n_exits] = i
+            n_exits += 1
+            in_trade = False
+        prev_pos = pos
+
+    return equity, strategy_returns, entries[:n_entries], exits[:n_exits]
+
+
+# error_model='numpy': a zero close gives inf/NaN like pandas instead of raising
+_run_kernel = njit(cache=True, error_model='numpy')(_run_kernel_py) if njit is not None else None
+
+
+def _format_dates(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Format a DatetimeIndex as YYYY-MM-DD strings.
+
+    WHY: Casting to datetime64[D] and then str is a single NumPy pass,
+    where strftime makes a Python-level format call per row. Timezone-aware
+    indexes are converted to wall time first so dates don't shift.
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype('datetime64[D]').astype(str)
+
+
+def warm_up() -> None:
+    """
+    Compile the Numba kernels (backtest loop, metrics and rolling
+    indicators) ahead of the first backtest.
+
+    WHY: JIT compilation happens on first call. Triggering it at startup
+    (before gunicorn forks, with cache=True persisting it to disk) keeps that
+    cost off the first user request.
+    """
+    if _run_kernel is None:
+        return
+    _run_kernel(np.ones(2), np.zeros(2), 1.0)
+    _warm_up_metrics()
+    _warm_up_indicators()
+
+
 class Backtester:
     """
     Backtesting engine that executes strategies on historical data.
@@ -49,7 +152,8 @@ class Backtester:
     def run(
         self,
         strategy: BaseStrategy,
-        data: pd.DataFrame
+        data: pd.DataFrame,
+        prepared: Optional[IndicatorCache] = None
     ) -> Dict[str, Any]:
         """
         Execute strategy backtest on historical data.
@@ -57,13 +161,15 @@ class Backtester:
         Args:
             strategy: Strategy instance implementing BaseStrategy
             data: DataFrame with OHLCV data
+            prepared: Optional IndicatorCache over data to read indicators
+                      from; by default each strategy computes its own
 
         Returns:
             Dictionary containing:
-            - equity_curve: Time series of portfolio value
-            - positions: Time series of positions held
+            - equity_curve: Time series of portfolio value (ndarray)
+            - positions: Time series of positions held (ndarray)
             - trades: List of individual trades
-            - returns: Period returns
+            - returns: Period returns (ndarray)
 
         WHY RETURN DICT: Flexible format that's easy to serialize to JSON
         for API responses. Contains all data needed for analysis.
@@ -75,43 +181,93 @@ class Backtester:
         4. Track equity curve
         5. Extract individual trades
         """
-        logger.info(f"Running backtest with {strategy.__class__.__name__}")
-
         # Validate input data
         self._validate_data(data)
 
+        return self._run_validated(strategy, data, prepared)
+
+    def _run_validated(
+        self,
+        strategy: BaseStrategy,
+        data: pd.DataFrame,
+        prepared: Optional[IndicatorCache]
+    ) -> Dict[str, Any]:
+        """Backtest body of run(), for data that has already passed _validate_data."""
+        logger.info(f"Running backtest with {strategy.__class__.__name__}")
+
         # Step 1: Generate trading signals
-        signals = strategy.generate_signals(data)
+        # WHY: Only strategies that opt in via generate_signals_prepared read
+        # the shared cache; the default hook just calls generate_signals(data)
+        if prepared is None:
+            signals = strategy.generate_signals(data)
+        else:
+            signals = strategy.generate_signals_prepared(data, prepared)
 
         # Step 2: Convert signals to positions
         positions = strategy.calculate_positions(signals)
 
-        # Step 3: Calculate returns
-        # WHY pct_change(): Gives us period-to-period returns
-        # WHY fillna(0): First return is NaN, treat as 0
-        returns = data['Close'].pct_change().fillna(0)
-
-        # Step 4: Calculate strategy returns
-        # Position * return gives us the return we capture
-        # WHY: If we're long (position=1) and market goes up (return=+0.02),
-        # we earn +0.02. If we're flat (position=0), we earn 0 regardless of market.
-        strategy_returns = positions['position'] * returns
-
-        # Step 5: Calculate equity curve
-        # WHY cumulative product: (1 + return) compounded over time
-        # Example: +2% then +3% = 1.02 * 1.03 = 1.0506 (5.06% total)
-        equity_curve = self.initial_capital * (1 + strategy_returns).cumprod()
-
-        # Step 6: Extract individual trades
-        trades = self._extract_trades(positions, data['Close'])
+        # Signals and positions share the data's index: format dates once
+        dates = _format_dates(data.index)
+
+        # Work on plain arrays from here: no index alignment, no intermediate Series
+        # WHY NOT prepared.close_values(): returns, equity and trade prices
+        # always come from the data this run was given, even if a caller
+        # passes a cache built before the frame was modified
+        # as_kernel_array: the compiled kernel only ever sees the contiguous
+        # layout warm_up() compiled for (archive columns are strided views)
+        close = as_kernel_array(data['Close'].to_numpy(dtype=np.float64))
+        position = as_kernel_array(positions['position'].to_numpy(dtype=np.float64))
+
+        if _run_kernel is not None:
+            # Steps 3-6 fused into one compiled pass over the bars
+            equity, strategy_returns, entries, exits = _run_kernel(
+                close, position, float(self.initial_capital)
+            )
+            trades = self._build_trades(dates, close, position, entries, exits)
+        else:
+            # Step 3: Calculate returns
+            # WHY: Period-to-period returns (close / previous close - 1);
+            # the first bar has no previous close, so its return is 0.
+            # Like pct_change().fillna(0), NaN closes are padded with the
+            # last valid close and undefined returns (NaN bars, 0/0) are 0.
+            padded = close
+            missing = np.isnan(close)
+            if missing.any():
+                last_valid = BaseStrategy._last_true_index(~missing)
+                padded = close[last_valid]
+                padded[last_valid < 0] = np.nan  # No valid close yet
+            returns = np.empty_like(close)
+            returns[0] = 0.0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.divide(padded[1:], padded[:-1], out=returns[1:])
+            returns[1:] -= 1.0
+            returns[np.isnan(returns)] = 0.0
+
+            # Step 4: Calculate strategy returns
+            # Position * return gives us the return we capture
+            # WHY: If we're long (position=1) and market goes up (return=+0.02),
+            # we earn +0.02. If we're flat (position=0), we earn 0 regardless of market.
+            strategy_returns = position * returns
+
+            # Step 5: Calculate equity curve
+            # WHY cumulative product: (1 + return) compounded over time
+            # Example: +2% then +3% = 1.02 * 1.03 = 1.0506 (5.06% total)
+            equity = self.initial_capital * np.cumprod(1.0 + strategy_returns)
+
+            # Step 6: Extract individual trades
+            trades = self._extract_trades(positions, data['Close'], dates)
 
         # Step 7: Compile results
+        # WHY NDARRAYS: Numeric series stay NumPy arrays; the API's orjson
+        # encoder serializes them straight from their buffers, so building
+        # thousands of Python floats with .tolist() would be wasted work
+        date_list = dates.tolist()
         results = {
-            'equity_curve': equity_curve.tolist(),
-            'equity_dates': equity_curve.index.strftime('%Y-%m-%d').tolist(),
-            'positions': positions['position'].tolist(),
-            'position_dates': positions.index.strftime('%Y-%m-%d').tolist(),
-            'returns': strategy_returns.tolist(),
+            'equity_curve': equity,
+            'equity_dates': date_list,
+            'positions': position,
+            'position_dates': date_list,
+            'returns': strategy_returns,
             'trades': trades,
             'initial_capital': self.initial_capital
         }
@@ -120,6 +276,20 @@ class Backtester:
 
         return results
 
+    def _prepare(self, data: pd.DataFrame) -> IndicatorCache:
+        """
+        Build an indicator cache to share between strategies run on data.
+
+        WHY LAZY: Indicators are computed on first request, so only windows
+        some strategy actually uses are ever calculated.
+
+        WHY PER CALL: The cache lives for one run_multiple_strategies call
+        (or as long as a caller keeps an explicitly passed one). A cache kept
+        across calls would hand back indicators computed before a frame was
+        modified in place.
+        """
+        return IndicatorCache(data)
+
     def _validate_data(self, data: pd.DataFrame) -> None:
         """
         Validate input data has required structure.
@@ -132,9 +302,8 @@ class Backtester:
         if data.empty:
             raise ValueError("Data is empty")
 
-        required_cols = ['Close', 'Open', 'High', 'Low']
-        missing = set(required_cols) - set(data.columns)
-        if missing:
+        if not _REQUIRED_COLUMNS.issubset(data.columns):
+            missing = set(_REQUIRED_COLUMNS.difference(data.columns))
             raise ValueError(f"Missing required columns: {missing}")
 
         if not isinstance(data.index, pd.DatetimeIndex):
@@ -146,7 +315,8 @@ class Backtester:
     def _extract_trades(
         self,
         positions: pd.DataFrame,
-        prices: pd.Series
+        prices: pd.Series,
+        dates: np.ndarray
     ) -> List[Dict[str, Any]]:
         """
         Extract individual trades from position time series.
@@ -154,6 +324,11 @@ class Backtester:
         A trade occurs when position changes from 0 to non-zero (entry)
         and back to 0 (exit).
 
+        Args:
+            positions: DataFrame with a 'position' column
+            prices: Close prices aligned with positions
+            dates: Formatted dates aligned with positions (see _format_dates)
+
         Returns:
             List of trade dictionaries with entry/exit dates, prices, and P&L
 
@@ -163,52 +338,77 @@ class Backtester:
         - Identifying best/worst trades
         - Detecting overfitting (too few trades = unreliable strategy)
 
-        ALGORITHM:
-        1. Find position changes (diff)
+        ALGORITHM (vectorized, O(N)):
+        1. Compare each position with the previous one (first bar follows flat)
         2. Entry = position goes from 0 to non-zero
         3. Exit = position goes from non-zero to 0
         4. Calculate P&L for each completed trade
         """
-        trades = []
-        position_changes = positions['position'].diff()
-
-        # Track current trade
-        current_trade = None
-
-        for date, pos in positions.iterrows():
-            current_pos = pos['position']
-            prev_pos = positions.loc[:date, 'position'].iloc[-2] if len(positions.loc[:date]) > 1 else 0
-
-            # Entry: position changes from 0 to non-zero
-            if prev_pos == 0 and current_pos != 0:
-                current_trade = {
-                    'entry_date': date.strftime('%Y-%m-%d'),
-                    'entry_price': prices.loc[date],
-                    'direction': 'long' if current_pos > 0 else 'short',
-                    'size': abs(current_pos)
-                }
-
-            # Exit: position changes from non-zero to 0
-            elif prev_pos != 0 and current_pos == 0 and current_trade is not None:
-                exit_price = prices.loc[date]
-                entry_price = current_trade['entry_price']
-
-                # Calculate P&L
-                # WHY: Long trade profits when price increases, short when decreases
-                if current_trade['direction'] == 'long':
-                    pnl_pct = (exit_price - entry_price) / entry_price
-                else:  # short
-                    pnl_pct = (entry_price - exit_price) / entry_price
-
-                current_trade['exit_date'] = date.strftime('%Y-%m-%d')
-                current_trade['exit_price'] = exit_price
-                current_trade['pnl_percent'] = pnl_pct * 100  # Convert to percentage
-                current_trade['pnl_dollars'] = self.initial_capital * pnl_pct
-
-                trades.append(current_trade)
-                current_trade = None
-
-        return trades
+        position = positions['position'].to_numpy(dtype=np.float64)
+        prev_position = np.concatenate(([0.0], position[:-1]))
+
+        # WHY NO STATE: Every non-zero run starts with an entry, so each exit
+        # always closes the most recent entry
+        entries = np.flatnonzero((prev_position == 0) & (position != 0))
+        exits = np.flatnonzero((prev_position != 0) & (position == 0))
+
+        return self._build_trades(
+            dates,
+            prices.to_numpy(dtype=np.float64),
+            position,
+            entries,
+            exits
+        )
+
+    def _build_trades(
+        self,
+        dates: np.ndarray,
+        prices: np.ndarray,
+        position: np.ndarray,
+        entries: np.ndarray,
+        exits: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        Build trade dictionaries from entry/exit bar indices.
+
+        Only completed trades are reported: entries[k] pairs with exits[k],
+        and a trade still open on the last bar is dropped.
+        """
+        # Pair entries with exits; an unmatched final entry is still open
+        entries = entries[:len(exits)]
+        entry_prices = prices[entries]
+        exit_prices = prices[exits]
+        entry_positions = position[entries]
+        is_long = entry_positions > 0
+
+        # WHY: Long trade profits when price increases, short when decreases
+        pnl_pct = np.where(
+            is_long,
+            (exit_prices - entry_prices) / entry_prices,
+            (entry_prices - exit_prices) / entry_prices
+        )
+
+        return [
+            {
+                'entry_date': entry_date,
+                'entry_price': entry_price,
+                'direction': 'long' if long else 'short',
+                'size': size,
+                'exit_date': exit_date,
+                'exit_price': exit_price,
+                'pnl_percent': pct * 100,  # Convert to percentage
+                'pnl_dollars': self.initial_capital * pct
+            }
+            for entry_date, entry_price, long, size, exit_date, exit_price, pct in zip(
+                dates[entries].tolist(),
+                entry_prices.tolist(),
+                is_long.tolist(),
+                np.abs(entry_positions).tolist(),
+                dates[exits].tolist(),
+                exit_prices.tolist(),
+                pnl_pct.tolist()
+            )
+        ]
 
     def run_multiple_strategies(
         self,
@@ -227,11 +427,16 @@ class Backtester:
 
         WHY: Comparing multiple strategies on same data is common workflow.
         This method makes it convenient and ensures same data is used.
+        The data is validated once and indicators are shared, so a window
+        two strategies both use is only computed once.
         """
         results = {}
 
+        self._validate_data(data)
+        prepared = self._prepare(data)
+
         for name, strategy in strategies:
             logger.info(f"Running strategy: {name}")
-            results[name] = self.run(strategy, data)
+            results[name] = self._run_validated(strategy, data, prepared)
 
         return results
@@ -2,152 +2,372 @@
 Performance Metrics and Risk Analytics
 
 Comprehensive performance and risk metric calculations for backtesting results.
+
+WHY ONE PASS: generate_performance_report needs a dozen metrics over the same
+two arrays. _compute_all converts the inputs to NumPy once and shares the
+intermediates (mean, std, downside returns, running max, the VaR quantile)
+between metrics, instead of every metric re-wrapping and re-scanning a
+pandas Series. The public calculate_* functions compute only their own
+metric, from the same per-metric helpers _compute_all_numpy is built on.
+When Numba is installed the same metrics come from a compiled kernel
+(engine/_perf_kernels.py); the NumPy implementation here is the fallback.
 """
 
-from typing import Dict, Any, List
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 import pandas as pd
 import numpy as np
+from engine._perf_kernels import _all_metrics
+from strategies.indicators import as_kernel_array
 
 
-def calculate_total_return(equity_curve: pd.Series) -> float:
-    """Calculate total return over the period."""
-    if len(equity_curve) < 2:
-        return 0.0
+# Metric inputs: a pandas Series, an ndarray or a plain list of floats. Each is
+# viewed as a float64 ndarray once; no Series is ever constructed.
+ArrayLike = Union[pd.Series, np.ndarray, Sequence[float]]
 
-    initial = equity_curve.iloc[0]
-    final = equity_curve.iloc[-1]
 
-    if initial == 0:
-        return 0.0
+@dataclass(frozen=True)
+class PerformanceStats:
+    """Equity- and return-based metrics produced by _compute_all."""
+    total_return: float
+    annualized_return: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    max_drawdown: float
+    calmar_ratio: float
+    volatility: float
+    var: float
+    cvar: float
 
-    return ((final - initial) / initial) * 100.0
 
+_ZERO_STATS = PerformanceStats(*([0.0] * len(PerformanceStats.__dataclass_fields__)))
 
-def calculate_annualized_return(equity_curve: pd.Series, periods_per_year: int = 252) -> float:
-    """Calculate annualized return."""
-    if len(equity_curve) < 2:
-        return 0.0
 
-    initial = equity_curve.iloc[0]
-    final = equity_curve.iloc[-1]
-    num_periods = len(equity_curve)
+def _as_array(values: ArrayLike) -> np.ndarray:
+    """View a Series, list or array as a float64 ndarray (no copy if already one)."""
+    if isinstance(values, pd.Series):
+        values = values.to_numpy()
+    return np.asarray(values, dtype=np.float64)
 
-    if initial == 0 or num_periods == 0:
-        return 0.0
 
-    total_return = final / initial
-    annualized = (total_return ** (periods_per_year / num_periods)) - 1
+@lru_cache(maxsize=16)
+def _sqrt_ppy(periods_per_year: int) -> float:
+    """Annualization factor sqrt(periods_per_year); only a few distinct values occur."""
+    return math.sqrt(periods_per_year)
 
-    return annualized * 100.0
 
+def _sample_std(values: np.ndarray, mean: float) -> float:
+    """
+    Sample standard deviation (ddof=1) given an already computed mean.
 
-def calculate_sharpe_ratio(
-    returns: pd.Series,
-    risk_free_rate: float = 0.02,
-    periods_per_year: int = 252
-) -> float:
-    """Calculate Sharpe Ratio - risk-adjusted return metric."""
-    if len(returns) < 2:
-        return 0.0
+    WHY: ndarray.std() re-derives the mean with its own pass over the data.
+    Reusing the mean leaves one pass, with the same subtract/square/sum steps
+    as NumPy, so the result is bit-identical to values.std(ddof=1).
+    """
+    deviations = values - mean
+    np.multiply(deviations, deviations, out=deviations)
+    return math.sqrt(deviations.sum() / (len(values) - 1))
 
-    mean_return = returns.mean()
-    volatility = returns.std()
 
-    if volatility == 0:
-        return np.inf if mean_return > 0 else 0.0
+def _calmar_from_scalars(annualized_return: float, max_drawdown: float) -> float:
+    """
+    Calmar Ratio from an already computed annualized return and max drawdown.
 
-    # Annualize metrics
-    mean_return_annual = mean_return * periods_per_year
-    volatility_annual = volatility * np.sqrt(periods_per_year)
+    WHY: Both inputs are computed anyway for the report; deriving Calmar from
+    them avoids another two sweeps over the equity curve.
+    """
+    if max_drawdown == 0:
+        return np.inf if annualized_return > 0 else 0.0
+    return annualized_return / abs(max_drawdown)
 
-    sharpe = (mean_return_annual - risk_free_rate) / volatility_annual
 
-    return sharpe
+def _total_return(equity: np.ndarray) -> float:
+    """Total return in percent (0.0 for fewer than 2 points or a zero start)."""
+    if len(equity) < 2 or equity[0] == 0:
+        return 0.0
+    initial = equity[0]
+    return ((equity[-1] - initial) / initial) * 100.0
 
 
-def calculate_sortino_ratio(
-    returns: pd.Series,
-    risk_free_rate: float = 0.02,
-    periods_per_year: int = 252
-) -> float:
-    """Calculate Sortino Ratio - penalizes only downside volatility."""
-    if len(returns) < 2:
+def _annualized_return(equity: np.ndarray, periods_per_year: int) -> float:
+    """Annualized return in percent (0.0 for fewer than 2 points or a zero start)."""
+    if len(equity) < 2 or equity[0] == 0:
         return 0.0
+    annualized = ((equity[-1] / equity[0]) ** (periods_per_year / len(equity))) - 1
+    return annualized * 100.0
 
-    mean_return = returns.mean()
-    downside_returns = returns[returns < 0]
 
-    if len(downside_returns) == 0:
+def _max_drawdown(equity: np.ndarray) -> float:
+    """Largest peak-to-trough decline in percent (0.0 for fewer than 2 points)."""
+    if len(equity) < 2:
+        return 0.0
+
+    # WHY ACCUMULATE: One ufunc pass gives the running peak. fmax skips NaN
+    # like expanding().max(); maximum would carry a NaN to every later peak.
+    running_max = np.fmax.accumulate(equity)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = (equity - running_max) / running_max
+    # A zero peak yields 0/0 = NaN; skip those like pandas' Series.min()
+    # did, leaving NaN only when no drawdown is defined at all.
+    nan_mask = np.isnan(drawdown)
+    if nan_mask.all():
+        return np.nan
+    if nan_mask.any():
+        return np.nanmin(drawdown) * 100.0
+    return drawdown.min() * 100.0
+
+
+def _sharpe_from_scalars(
+    mean_return: float,
+    std: float,
+    risk_free_rate: float,
+    periods_per_year: int
+) -> float:
+    """Sharpe Ratio from an already computed mean and sample std of returns."""
+    if std == 0:
         return np.inf if mean_return > 0 else 0.0
+    return (mean_return * periods_per_year - risk_free_rate) / (std * _sqrt_ppy(periods_per_year))
 
-    downside_deviation = downside_returns.std()
 
-    if downside_deviation == 0:
+def _sortino_from_mean(
+    returns: np.ndarray,
+    mean_return: float,
+    risk_free_rate: float,
+    periods_per_year: int
+) -> float:
+    """Sortino Ratio given an already computed mean of returns."""
+    downside = returns[returns < 0]
+    if len(downside) == 0:
+        return np.inf if mean_return > 0 else 0.0
+
+    # Sample std of a single value is undefined (NaN), as in pandas
+    if len(downside) > 1:
+        downside_std = _sample_std(downside, float(downside.mean()))
+    else:
+        downside_std = np.nan
+    if downside_std == 0:
         return np.inf if mean_return > 0 else 0.0
+    return (mean_return * periods_per_year - risk_free_rate) / (downside_std * _sqrt_ppy(periods_per_year))
+
+
+def _check_confidence(confidence: float) -> None:
+    """Reject confidence levels outside [0, 1] (NaN included)."""
+    if not 0 <= confidence <= 1:
+        raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+
+
+def _var_threshold(returns: np.ndarray, confidence: float) -> float:
+    """
+    Return quantile at (1 - confidence), as a fraction.
+
+    WHY PARTITION: np.percentile sorts the whole array. Only the two order
+    statistics around the quantile are needed, which np.partition
+    (quickselect) finds in O(N). They are interpolated exactly as
+    np.percentile's default 'linear' method does, so VaR is unchanged.
+
+    Args:
+        returns: Period returns, at least one element
+        confidence: Confidence level, e.g. 0.95 for the 5% tail
+
+    Raises:
+        ValueError: If confidence is outside [0, 1], as np.percentile did
+    """
+    _check_confidence(confidence)
+    n = len(returns)
+    # Same float steps as np.percentile(returns, (1 - confidence) * 100)
+    virtual_index = (n - 1) * (((1 - confidence) * 100) / 100)
+    lower = int(np.floor(virtual_index))
+    if lower >= n - 1:
+        return np.partition(returns, n - 1)[n - 1]
+
+    part = np.partition(returns, (lower, lower + 1))
+    below = part[lower]
+    above = part[lower + 1]
+    t = virtual_index - lower
+    diff = above - below
+    return above - diff * (1 - t) if t >= 0.5 else below + diff * t
+
+
+def _cvar_from_threshold(returns: np.ndarray, threshold: float) -> float:
+    """Mean of returns at or below the VaR threshold, in percent."""
+    # Ties with the threshold can sit anywhere past the partition pivot,
+    # so the tail is taken with a mask rather than from a partitioned slice.
+    tail = returns[returns <= threshold]
+    return tail.mean() * 100.0 if len(tail) else 0.0
+
+
+def _compute_all_numpy(
+    equity: np.ndarray,
+    returns: np.ndarray,
+    risk_free_rate: float = 0.02,
+    periods_per_year: int = 252,
+    confidence: float = 0.95
+) -> PerformanceStats:
+    """
+    Compute every equity- and return-based metric with NumPy reductions.
+
+    Args:
+        equity: Equity curve as float64 array (may be empty)
+        returns: Period returns as float64 array (may be empty)
+
+    Returns:
+        PerformanceStats, with each metric following the edge-case rules of
+        its calculate_* function (e.g. 0.0 for fewer than 2 points)
+    """
+    # Equity-based metrics
+    annualized_return = _annualized_return(equity, periods_per_year)
+    max_drawdown = _max_drawdown(equity)
+
+    # Return-based metrics: mean and std are computed once and shared
+    sharpe_ratio = 0.0
+    sortino_ratio = 0.0
+    volatility = 0.0
+    var = 0.0
+    cvar = 0.0
+    if len(returns) >= 2:
+        # Python floats: the scalar arithmetic below skips NumPy scalar dispatch
+        mean_return = float(returns.mean())
+        std = _sample_std(returns, mean_return)
+        sharpe_ratio = _sharpe_from_scalars(mean_return, std, risk_free_rate, periods_per_year)
+        sortino_ratio = _sortino_from_mean(returns, mean_return, risk_free_rate, periods_per_year)
+        volatility = std * _sqrt_ppy(periods_per_year) * 100.0
+        threshold = _var_threshold(returns, confidence)
+        var = threshold * 100.0
+        cvar = _cvar_from_threshold(returns, threshold)
+
+    return PerformanceStats(
+        total_return=_total_return(equity),
+        annualized_return=annualized_return,
+        sharpe_ratio=sharpe_ratio,
+        sortino_ratio=sortino_ratio,
+        max_drawdown=max_drawdown,
+        calmar_ratio=_calmar_from_scalars(annualized_return, max_drawdown),
+        volatility=volatility,
+        var=var,
+        cvar=cvar
+    )
 
-    # Annualize metrics
-    mean_return_annual = mean_return * periods_per_year
-    downside_deviation_annual = downside_deviation * np.sqrt(periods_per_year)
 
-    sortino = (mean_return_annual - risk_free_rate) / downside_deviation_annual
+def _compute_all(
+    equity: np.ndarray,
+    returns: np.ndarray,
+    risk_free_rate: float = 0.02,
+    periods_per_year: int = 252,
+    confidence: float = 0.95
+) -> PerformanceStats:
+    """
+    Compute every equity- and return-based metric in one sweep.
+
+    Uses the compiled kernel when Numba is available, otherwise
+    _compute_all_numpy. Both follow the same edge-case rules.
+    """
+    # Fewer than 2 points on both sides: every metric is 0.0 by definition,
+    # so skip the kernel / NumPy dispatch (e.g. strategies that never traded
+    # in a short sweep window)
+    if len(equity) < 2 and len(returns) < 2:
+        return _ZERO_STATS
+    if _all_metrics is None:
+        return _compute_all_numpy(equity, returns, risk_free_rate, periods_per_year, confidence)
+    if len(returns) >= 2:
+        _check_confidence(confidence)  # Same error as the NumPy path
+    return PerformanceStats(*_all_metrics(
+        as_kernel_array(equity),
+        as_kernel_array(returns),
+        float(risk_free_rate),
+        int(periods_per_year),
+        float(confidence)
+    ))
 
-    return sortino
 
+def calculate_total_return(equity_curve: ArrayLike) -> float:
+    """Calculate total return over the period."""
+    return _total_return(_as_array(equity_curve))
 
-def calculate_max_drawdown(equity_curve: pd.Series) -> float:
-    """Calculate maximum drawdown - largest peak-to-trough decline."""
-    if len(equity_curve) < 2:
+
+def calculate_annualized_return(equity_curve: ArrayLike, periods_per_year: int = 252) -> float:
+    """Calculate annualized return."""
+    return _annualized_return(_as_array(equity_curve), periods_per_year)
+
+
+def calculate_sharpe_ratio(
+    returns: ArrayLike,
+    risk_free_rate: float = 0.02,
+    periods_per_year: int = 252
+) -> float:
+    """Calculate Sharpe Ratio - risk-adjusted return metric."""
+    returns = _as_array(returns)
+    if len(returns) < 2:
         return 0.0
+    mean_return = float(returns.mean())
+    return _sharpe_from_scalars(
+        mean_return, _sample_std(returns, mean_return), risk_free_rate, periods_per_year
+    )
 
-    running_max = equity_curve.expanding().max()
-    drawdown = (equity_curve - running_max) / running_max
-    max_dd = drawdown.min()
 
-    return max_dd * 100.0
+def calculate_sortino_ratio(
+    returns: ArrayLike,
+    risk_free_rate: float = 0.02,
+    periods_per_year: int = 252
+) -> float:
+    """Calculate Sortino Ratio - penalizes only downside volatility."""
+    returns = _as_array(returns)
+    if len(returns) < 2:
+        return 0.0
+    return _sortino_from_mean(returns, float(returns.mean()), risk_free_rate, periods_per_year)
+
+
+def calculate_max_drawdown(equity_curve: ArrayLike) -> float:
+    """Calculate maximum drawdown - largest peak-to-trough decline."""
+    return _max_drawdown(_as_array(equity_curve))
 
 
 def calculate_calmar_ratio(
-    equity_curve: pd.Series,
+    equity_curve: ArrayLike,
     periods_per_year: int = 252
 ) -> float:
     """Calculate Calmar Ratio = Annualized Return / |Max Drawdown|."""
-    ann_return = calculate_annualized_return(equity_curve, periods_per_year)
-    max_dd = calculate_max_drawdown(equity_curve)
+    equity = _as_array(equity_curve)
+    return _calmar_from_scalars(
+        _annualized_return(equity, periods_per_year), _max_drawdown(equity)
+    )
 
-    if max_dd == 0:
-        return np.inf if ann_return > 0 else 0.0
 
-    calmar = ann_return / abs(max_dd)
+def _trades_to_arrays(trades: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert a list of trade dicts to (pnl_percent, pnl_dollars) float64 arrays.
 
-    return calmar
+    WHY: The trade metrics each used to scan the list of dicts in Python.
+    Pulling the two columns out once lets every metric run as a masked
+    NumPy reduction. Missing keys count as 0, as before.
+    """
+    count = len(trades)
+    pnl_pct = np.fromiter(
+        (t.get('pnl_percent', 0.0) for t in trades), dtype=np.float64, count=count
+    )
+    pnl_dollars = np.fromiter(
+        (t.get('pnl_dollars', 0.0) for t in trades), dtype=np.float64, count=count
+    )
+    return pnl_pct, pnl_dollars
 
 
-def calculate_win_rate(trades: List[Dict[str, Any]]) -> float:
-    """Calculate win rate - percentage of profitable trades."""
-    if not trades:
+def _win_rate(pnl_pct: np.ndarray) -> float:
+    """Win rate from an array of trade returns (percent)."""
+    if len(pnl_pct) == 0:
         return 0.0
+    # count_nonzero counts the mask directly instead of averaging it as floats;
+    # (wins / total) * 100 keeps the original rounding order
+    return (np.count_nonzero(pnl_pct > 0) / len(pnl_pct)) * 100.0
 
-    winning_trades = sum(1 for trade in trades if trade.get('pnl_percent', 0) > 0)
 
-    return (winning_trades / len(trades)) * 100.0
-
-
-def calculate_profit_factor(trades: List[Dict[str, Any]]) -> float:
-    """Calculate profit factor = Gross Profit / Gross Loss."""
-    if not trades:
+def _profit_factor(pnl_dollars: np.ndarray) -> float:
+    """Profit factor from an array of trade P&L (dollars)."""
+    if len(pnl_dollars) == 0:
         return 0.0
 
-    gross_profit = sum(
-        trade.get('pnl_dollars', 0)
-        for trade in trades
-        if trade.get('pnl_dollars', 0) > 0
-    )
-
-    gross_loss = abs(sum(
-        trade.get('pnl_dollars', 0)
-        for trade in trades
-        if trade.get('pnl_dollars', 0) < 0
-    ))
+    gross_profit = pnl_dollars[pnl_dollars > 0].sum()
+    gross_loss = -pnl_dollars[pnl_dollars < 0].sum()
 
     if gross_loss == 0:
         return np.inf if gross_profit > 0 else 0.0
@@ -155,16 +375,16 @@ def calculate_profit_factor(trades: List[Dict[str, Any]]) -> float:
     return gross_profit / gross_loss
 
 
-def calculate_average_win_loss(trades: List[Dict[str, Any]]) -> Dict[str, float]:
-    """Calculate average winning and losing trade sizes."""
-    if not trades:
+def _avg_win_loss(pnl_pct: np.ndarray) -> Dict[str, float]:
+    """Average win / loss sizes from an array of trade returns (percent)."""
+    if len(pnl_pct) == 0:
         return {'avg_win': 0.0, 'avg_loss': 0.0, 'win_loss_ratio': 0.0}
 
-    wins = [t['pnl_percent'] for t in trades if t.get('pnl_percent', 0) > 0]
-    losses = [abs(t['pnl_percent']) for t in trades if t.get('pnl_percent', 0) < 0]
+    wins = pnl_pct[pnl_pct > 0]
+    losses = pnl_pct[pnl_pct < 0]
 
-    avg_win = np.mean(wins) if wins else 0.0
-    avg_loss = np.mean(losses) if losses else 0.0
+    avg_win = wins.mean() if len(wins) else 0.0
+    avg_loss = -losses.mean() if len(losses) else 0.0
 
     win_loss_ratio = avg_win / avg_loss if avg_loss > 0 else 0.0
 
@@ -175,94 +395,133 @@ def calculate_average_win_loss(trades: List[Dict[str, Any]]) -> Dict[str, float]
     }
 
 
-def calculate_var(returns: pd.Series, confidence: float = 0.95) -> float:
-    """Calculate Value at Risk (VaR) - maximum expected loss at given confidence."""
-    if len(returns) < 2:
-        return 0.0
+def calculate_win_rate(trades: List[Dict[str, Any]]) -> float:
+    """Calculate win rate - percentage of profitable trades."""
+    return _win_rate(_trades_to_arrays(trades)[0])
 
-    var = np.percentile(returns, (1 - confidence) * 100)
 
-    return var * 100.0
+def calculate_profit_factor(trades: List[Dict[str, Any]]) -> float:
+    """Calculate profit factor = Gross Profit / Gross Loss."""
+    return _profit_factor(_trades_to_arrays(trades)[1])
 
 
-def calculate_cvar(returns: pd.Series, confidence: float = 0.95) -> float:
-    """Calculate Conditional VaR (CVaR / Expected Shortfall)."""
-    if len(returns) < 2:
-        return 0.0
+def calculate_average_win_loss(trades: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Calculate average winning and losing trade sizes."""
+    return _avg_win_loss(_trades_to_arrays(trades)[0])
 
-    var_threshold = np.percentile(returns, (1 - confidence) * 100)
-    tail_returns = returns[returns <= var_threshold]
 
-    if len(tail_returns) == 0:
+def calculate_var(returns: ArrayLike, confidence: float = 0.95) -> float:
+    """Calculate Value at Risk (VaR) - maximum expected loss at given confidence."""
+    returns = _as_array(returns)
+    if len(returns) < 2:
         return 0.0
+    return _var_threshold(returns, confidence) * 100.0
 
-    cvar = tail_returns.mean()
 
-    return cvar * 100.0
+def calculate_cvar(returns: ArrayLike, confidence: float = 0.95) -> float:
+    """Calculate Conditional VaR (CVaR / Expected Shortfall)."""
+    returns = _as_array(returns)
+    if len(returns) < 2:
+        return 0.0
+    return _cvar_from_threshold(returns, _var_threshold(returns, confidence))
 
 
-def calculate_volatility(returns: pd.Series, periods_per_year: int = 252) -> float:
+def calculate_volatility(returns: ArrayLike, periods_per_year: int = 252) -> float:
     """Calculate annualized volatility (standard deviation of returns)."""
+    returns = _as_array(returns)
     if len(returns) < 2:
         return 0.0
+    return _sample_std(returns, float(returns.mean())) * _sqrt_ppy(periods_per_year) * 100.0
 
-    vol = returns.std()
-    vol_annual = vol * np.sqrt(periods_per_year)
 
-    return vol_annual * 100.0
+def returns_from_equity(equity_curve: ArrayLike) -> np.ndarray:
+    """
+    Derive simple period returns from an equity curve.
+
+    Returns:
+        Array the same length as the curve: 0.0 for the first bar (as the
+        backtester reports it) and equity[i] / equity[i-1] - 1 after that,
+        with 0.0 where the previous value is 0. For log returns use
+        np.diff(np.log(equity)) instead.
+    """
+    equity = _as_array(equity_curve)
+    returns = np.zeros(len(equity))
+    if len(equity) > 1:
+        np.divide(equity[1:], equity[:-1], out=returns[1:], where=equity[:-1] != 0)
+        returns[1:] -= 1.0
+        returns[1:][equity[:-1] == 0] = 0.0
+    return returns
 
 
 def generate_performance_report(
-    equity_curve: List[float],
-    returns: List[float],
+    equity_curve: ArrayLike,
+    returns: Optional[ArrayLike],
     trades: List[Dict[str, Any]],
-    initial_capital: float
+    initial_capital: float,
+    round_output: bool = True
 ) -> Dict[str, Any]:
-    """Generate comprehensive performance report."""
-    equity_series = pd.Series(equity_curve)
-    returns_series = pd.Series(returns)
-
-    # Calculate all metrics
-    total_return = calculate_total_return(equity_series)
-    ann_return = calculate_annualized_return(equity_series)
-    sharpe = calculate_sharpe_ratio(returns_series)
-    sortino = calculate_sortino_ratio(returns_series)
-    max_dd = calculate_max_drawdown(equity_series)
-    calmar = calculate_calmar_ratio(equity_series)
-    win_rate = calculate_win_rate(trades)
-    profit_factor = calculate_profit_factor(trades)
-    avg_metrics = calculate_average_win_loss(trades)
-    var_95 = calculate_var(returns_series, 0.95)
-    cvar_95 = calculate_cvar(returns_series, 0.95)
-    volatility = calculate_volatility(returns_series)
-
+    """
+    Generate comprehensive performance report.
+
+    Pass returns=None to derive simple returns from the equity curve
+    (see returns_from_equity) instead of computing them caller-side.
+
+    round_output rounds every metric to 2 decimals and reports an infinite
+    profit factor as 'Inf', for display. Batch callers (parameter sweeps)
+    can pass False to get the raw floats and skip the formatting pass.
+    """
+    equity = _as_array(equity_curve)
+    returns = returns_from_equity(equity) if returns is None else _as_array(returns)
+    pnl_pct, pnl_dollars = _trades_to_arrays(trades)
+
+    # Calculate all metrics (arrays converted once, intermediates shared)
+    stats = _compute_all(equity, returns, confidence=0.95)
+    avg_metrics = _avg_win_loss(pnl_pct)
+
+    # Metrics are coerced to plain Python floats so no NumPy scalar types
+    # leak into the report (JSON encoders then take their native float path)
     report = {
         'performance_metrics': {
-            'total_return': round(total_return, 2),
-            'annualized_return': round(ann_return, 2),
-            'sharpe_ratio': round(sharpe, 2),
-            'sortino_ratio': round(sortino, 2),
-            'calmar_ratio': round(calmar, 2)
+            'total_return': float(stats.total_return),
+            'annualized_return': float(stats.annualized_return),
+            'sharpe_ratio': float(stats.sharpe_ratio),
+            'sortino_ratio': float(stats.sortino_ratio),
+            'calmar_ratio': float(stats.calmar_ratio)
         },
         'risk_metrics': {
-            'max_drawdown': round(max_dd, 2),
-            'annualized_volatility': round(volatility, 2),
-            'var_95': round(var_95, 2),
-            'cvar_95': round(cvar_95, 2)
+            'max_drawdown': float(stats.max_drawdown),
+            'annualized_volatility': float(stats.volatility),
+            'var_95': float(stats.var),
+            'cvar_95': float(stats.cvar)
         },
         'trade_metrics': {
             'total_trades': len(trades),
-            'win_rate': round(win_rate, 2),
-            'profit_factor': round(profit_factor, 2) if profit_factor != np.inf else 'Inf',
-            'avg_win': round(avg_metrics['avg_win'], 2),
-            'avg_loss': round(avg_metrics['avg_loss'], 2),
-            'win_loss_ratio': round(avg_metrics['win_loss_ratio'], 2)
+            'win_rate': float(_win_rate(pnl_pct)),
+            'profit_factor': float(_profit_factor(pnl_dollars)),
+            'avg_win': float(avg_metrics['avg_win']),
+            'avg_loss': float(avg_metrics['avg_loss']),
+            'win_loss_ratio': float(avg_metrics['win_loss_ratio'])
         },
         'summary': {
             'initial_capital': initial_capital,
-            'final_capital': round(equity_curve[-1], 2) if equity_curve else initial_capital,
-            'total_pnl': round(equity_curve[-1] - initial_capital, 2) if equity_curve else 0.0
+            'final_capital': float(equity[-1]) if len(equity) else initial_capital,
+            'total_pnl': float(equity[-1]) - initial_capital if len(equity) else 0.0
         }
     }
 
+    if round_output:
+        _round_report(report)
+
     return report
+
+
+def _round_report(report: Dict[str, Any]) -> None:
+    """Round a report's float metrics to 2 decimals in place, for display."""
+    for section in report.values():
+        for key, value in section.items():
+            if key == 'initial_capital' or not isinstance(value, float):
+                continue
+            if key == 'profit_factor' and value == np.inf:
+                section[key] = 'Inf'
+            else:
+                section[key] = round(value, 2)
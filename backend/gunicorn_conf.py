@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for production deployments.
+
+Usage: gunicorn -c gunicorn_conf.py app:app
+
+WHY PRELOAD: The app (static data, strategy registry, precomputed results)
+is imported once in the master and then forked, so workers share those
+pages copy-on-write instead of each loading its own copy.
+
+WHY THREADS (not gevent): Backtests are CPU-bound NumPy/pandas work that
+would stall a gevent event loop. Threaded workers still overlap blocking
+data I/O, and NumPy releases the GIL in its inner loops.
+"""
+
+import os
+
+# Render/Heroku set PORT; default matches the development server
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# WHY FIXED DEFAULT: Every worker holds its own copy of the data caches and
+# compiled kernels, and cpu_count() reports the host's cores rather than the
+# container's share, so 2*CPU+1 oversubscribes small instances. Two workers
+# (x threads) match the original Procfile; WEB_CONCURRENCY overrides it.
+workers = int(os.getenv('WEB_CONCURRENCY', 2))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+preload_app = True
+timeout = 120
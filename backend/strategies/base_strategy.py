@@ -10,9 +10,24 @@ making it easy to swap strategies and maintain consistency across the platform.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any
+import logging
 import pandas as pd
 import numpy as np
+from .indicators import IndicatorCache
+
+
+@lru_cache(maxsize=1024)
+def _warn_once(logger_name: str, message: str) -> None:
+    """
+    Log a parameter warning the first time each distinct message is seen.
+
+    WHY: Parameter sweeps build thousands of strategies; an unusual value
+    shared by many grid points (e.g. num_std=1.0 across every window) would
+    otherwise log the same line once per point.
+    """
+    logging.getLogger(logger_name).warning(message)
 
 
 class BaseStrategy(ABC):
@@ -42,6 +57,10 @@ class BaseStrategy(ABC):
         self.parameters = parameters or {}
         self.validate_parameters()
 
+    def _warn(self, message: str) -> None:
+        """Warn about an unusual (but valid) parameter, once per message."""
+        _warn_once(type(self).__module__, message)
+
     @abstractmethod
     def validate_parameters(self) -> None:
         """
@@ -70,6 +89,7 @@ class BaseStrategy(ABC):
             - 1.0: Buy signal (go long)
             - 0.0: Neutral (flat/no position)
             - -1.0: Sell signal (go short or exit long)
+            Any numeric dtype works; the built-in strategies use int8.
 
         WHY: Separating signal generation from position management allows for
         easier testing and strategy composition. Signals represent trade ideas,
@@ -77,6 +97,27 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def generate_signals_prepared(
+        self,
+        data: pd.DataFrame,
+        prepared: IndicatorCache
+    ) -> pd.DataFrame:
+        """
+        Generate signals, reading indicators from a shared IndicatorCache.
+
+        Args:
+            data: Same as generate_signals()
+            prepared: IndicatorCache over data, shared between strategies
+                      so common indicators are computed once
+
+        WHY OPT-IN HOOK: The Backtester calls this when it holds an
+        IndicatorCache (e.g. run_multiple_strategies). Strategies that build
+        their indicators from IndicatorCache override it; the default ignores
+        the cache, so subclasses that only implement generate_signals(data)
+        keep working unchanged.
+        """
+        return self.generate_signals(data)
+
     def calculate_positions(self, signals: pd.DataFrame) -> pd.DataFrame:
         """
         Convert signals to positions using forward-fill.
@@ -95,22 +136,60 @@ class BaseStrategy(ABC):
         - First position starts at 0 (no position before first signal)
         - Positions are shifted by 1 to avoid look-ahead bias (trade on next bar)
         """
-        positions = pd.DataFrame(index=signals.index)
-
-        # Replace NaN signals with 0 (no signal = no change)
-        signals_filled = signals['signal'].fillna(0)
+        signal = signals['signal'].to_numpy(dtype=np.float64)
 
         # Forward-fill to maintain positions until next signal
-        # WHY: This simulates holding a position until explicitly closing it
-        positions['position'] = signals_filled.replace(0, np.nan).ffill().fillna(0)
+        # WHY: This simulates holding a position until explicitly closing it.
+        # NaN and 0 both mean "no new signal". Carry each bar's latest non-zero
+        # signal forward via a running max of its index (-1 = none yet -> 0).
+        has_signal = signal != 0
+        has_signal &= ~np.isnan(signal)
+        last_signal = self._last_true_index(has_signal)
+        held = np.where(last_signal >= 0, signal[last_signal], 0.0)
 
         # Shift by 1 to avoid look-ahead bias
         # WHY: In real trading, you can't act on today's close until tomorrow's open.
         # This shift ensures we trade on the NEXT bar after a signal, preventing
         # unrealistic returns from impossible same-bar execution.
-        positions['position'] = positions['position'].shift(1).fillna(0)
+        return self._lag_positions(held, signals.index)
 
-        return positions
+    @staticmethod
+    def _last_true_index(mask: np.ndarray) -> np.ndarray:
+        """
+        For each bar, the index of the latest bar where mask is True (-1 if none yet).
+
+        WHY: This is a vectorized forward-fill: indexing with the result
+        carries the value at the last event forward, with no Python loop.
+        """
+        last = np.where(mask, np.arange(len(mask)), -1)
+        np.maximum.accumulate(last, out=last)
+        return last
+
+    @staticmethod
+    def _long_only_state(signal: np.ndarray) -> np.ndarray:
+        """
+        Long/flat holding state from buy (1) / sell (-1) signals, as int8.
+
+        1 from a buy until the next sell, 0 before the first buy and after a
+        sell; any other signal value keeps the current state.
+        """
+        is_event = (signal == 1) | (signal == -1)
+        last_event = BaseStrategy._last_true_index(is_event)
+        return ((last_event >= 0) & (signal[last_event] == 1)).astype(np.int8)
+
+    @staticmethod
+    def _lag_positions(held: np.ndarray, index: pd.Index) -> pd.DataFrame:
+        """
+        Build the 'position' frame from per-bar holdings, lagged by one bar.
+
+        Equivalent to Series.shift(1).fillna(0) on the holdings, done as one
+        array copy instead of two pandas passes; the frame wraps that array
+        without copying it again.
+        """
+        position = np.zeros(len(held))
+        position[1:] = held[:-1]
+        position[np.isnan(position)] = 0.0
+        return pd.DataFrame({'position': position}, index=index, copy=False)
 
     def get_parameter_info(self) -> Dict[str, Any]:
         """
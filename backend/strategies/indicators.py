@@ -0,0 +1,339 @@
+"""
+Shared technical indicators with per-dataset memoization.
+
+WHY: Strategies often need the same indicator on the same data (a 20-day
+SMA is both a moving-average line and the Bollinger middle band). When
+several strategies run over one dataset, e.g. Backtester.run_multiple_strategies,
+an IndicatorCache built once lets each rolling window be computed once.
+
+DESIGN DECISION: Indicators are computed lazily on first request rather
+than precomputing a fixed menu of windows. Only what some strategy actually
+asks for is ever computed, and any window size is supported.
+"""
+
+from typing import Callable, Dict, Hashable, Tuple, Union
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; pandas rolling is the fallback
+    njit = None
+
+
+def as_kernel_array(values: np.ndarray) -> np.ndarray:
+    """
+    values as a C-contiguous, writable float64 array (copied only if needed).
+
+    WHY: Numba compiles a separate specialization per array layout and
+    writability, and warm_up() compiles the kernels for plain contiguous
+    arrays. A column of the memory-mapped static archive is a strided,
+    read-only view; passed as is, it would trigger a fresh JIT compile on
+    the first request that reads it.
+    """
+    return np.require(values, dtype=np.float64, requirements=['C', 'W'])
+
+
+def _rolling_mean_std_py(close: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample standard deviation in one pass.
+
+    Returns:
+        (mean, std) arrays, NaN until a full window of non-NaN values
+
+    WHY: Bollinger Bands need both over the same window; pandas computes
+    them in two separate passes. This is a port of pandas' own online
+    algorithms (roll_mean: Kahan-compensated sum; roll_var: Welford with
+    Kahan compensation, plus the repeated-value rule that makes constant
+    windows exactly mean=value, std=0), so results are bit-identical to
+    Series.rolling(window, min_periods=window).mean() / .std().
+
+    NOTE: Do not compile with fastmath - it would optimize away the
+    compensation terms and break parity.
+    """
+    n = close.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+
+    nobs = 0
+    # Mean state: Kahan sum with separate add/remove compensation
+    sum_x = 0.0
+    sum_comp_add = 0.0
+    sum_comp_remove = 0.0
+    neg_count = 0
+    # Variance state: Welford mean / sum of squared deviations
+    mean_x = 0.0
+    ssqdm_x = 0.0
+    var_comp_add = 0.0
+    var_comp_remove = 0.0
+    # Trailing run of identical values (constant-window detection)
+    num_same = 0
+    prev_value = close[0] if n > 0 else 0.0
+
+    for i in range(n):
+        if i >= window:
+            val = close[i - window]
+            if val == val:  # not NaN
+                nobs -= 1
+                y = -val - sum_comp_remove
+                t = sum_x + y
+                sum_comp_remove = t - sum_x - y
+                sum_x = t
+                if np.signbit(val):
+                    neg_count -= 1
+
+                if nobs:
+                    prev_mean = mean_x - var_comp_remove
+                    y = val - var_comp_remove
+                    t = y - mean_x
+                    var_comp_remove = t + mean_x - y
+                    mean_x = mean_x - t / nobs
+                    ssqdm_x = ssqdm_x - (val - prev_mean) * (val - mean_x)
+                else:
+                    mean_x = 0.0
+                    ssqdm_x = 0.0
+
+        val = close[i]
+        if val == val:
+            nobs += 1
+            y = val - sum_comp_add
+            t = sum_x + y
+            sum_comp_add = t - sum_x - y
+            sum_x = t
+            if np.signbit(val):
+                neg_count += 1
+
+            if val == prev_value:
+                num_same += 1
+            else:
+                num_same = 1
+            prev_value = val
+
+            prev_mean = mean_x - var_comp_add
+            y = val - var_comp_add
+            t = y - mean_x
+            var_comp_add = t + mean_x - y
+            mean_x = mean_x + t / nobs
+            ssqdm_x = ssqdm_x + (val - prev_mean) * (val - mean_x)
+
+        if nobs >= window:
+            if num_same >= nobs:
+                mean_out[i] = prev_value
+            else:
+                result = sum_x / nobs
+                if neg_count == 0 and result < 0:
+                    result = 0.0
+                elif neg_count == nobs and result > 0:
+                    result = 0.0
+                mean_out[i] = result
+
+            if nobs > 1:
+                if num_same >= nobs:
+                    std_out[i] = 0.0
+                else:
+                    variance = ssqdm_x / (nobs - 1)
+                    std_out[i] = np.sqrt(variance) if variance >= 0 else 0.0
+
+    return mean_out, std_out
+
+
+_rolling_mean_std = njit(cache=True)(_rolling_mean_std_py) if njit is not None else None
+
+
+def _rsi_py(close: np.ndarray, span: float) -> np.ndarray:
+    """
+    RSI over an EWM (span, adjust=False) of gains and losses, in one pass.
+
+    WHY: The pandas version builds a diff, gain and loss arrays, two ewm()
+    means, a ratio and a fillna - seven full-length temporaries. This walks the
+    prices once. The recurrence is pandas' own adjust=False ewm (alpha from
+    the span via the centre of mass, renormalized by the weight sum, skipped
+    when the value is unchanged), so results are bit-identical to the pandas
+    path below.
+    """
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    com = (span - 1) / 2.0
+    alpha = 1.0 / (1.0 + com)
+    old_wt = 1.0 - alpha
+
+    # First bar has no price change: zero gain and loss (the sign of a zero
+    # average never changes the RSI)
+    avg_gain = 0.0
+    avg_loss = -0.0
+    for i in range(n):
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -(delta if delta < 0 else 0.0)
+            if avg_gain != gain:
+                avg_gain = (old_wt * avg_gain + alpha * gain) / (old_wt + alpha)
+            if avg_loss != loss:
+                avg_loss = (old_wt * avg_loss + alpha * loss) / (old_wt + alpha)
+
+        # No losses in the average: RSI is 100 (pandas' 0/0 and x/0 -> fillna)
+        if avg_loss == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
+# error_model='numpy': x/0 gives inf/NaN like pandas instead of raising
+_rsi = njit(cache=True, error_model='numpy')(_rsi_py) if njit is not None else None
+
+
+def warm_up() -> None:
+    """Compile the indicator kernels ahead of the first backtest."""
+    if _rolling_mean_std is None:
+        return
+    _rolling_mean_std(np.ones(3), 2)
+    _rsi(np.ones(3), 2.0)
+
+
+def _use_rsi_kernel(window: float) -> bool:
+    """Whether the compiled RSI applies (other windows get pandas' errors)."""
+    return (
+        _rsi is not None
+        and isinstance(window, (int, float, np.number))
+        and not isinstance(window, bool)
+        and window >= 1
+    )
+
+
+def calculate_rsi(prices: pd.Series, window: int) -> pd.Series:
+    """
+    Calculate RSI (Relative Strength Index).
+
+    Args:
+        prices: Series of closing prices
+        window: RSI period
+
+    Returns:
+        Series of RSI values (0-100)
+    """
+    if _use_rsi_kernel(window):
+        return pd.Series(
+            _rsi(as_kernel_array(prices.to_numpy(dtype=np.float64)), float(window)),
+            index=prices.index, name=prices.name
+        )
+
+    # Price changes straight on the ndarray (Series.diff() adds pandas dispatch)
+    values = prices.to_numpy(dtype=np.float64)
+    delta = np.empty_like(values)
+    delta[:1] = np.nan
+    np.subtract(values[1:], values[:-1], out=delta[1:])
+
+    # fmax instead of where(mask, ...): no boolean masks, and NaN -> 0 the same way.
+    # Losses reuse the delta buffer in place.
+    gains = np.fmax(delta, 0.0)
+    losses = np.fmax(np.negative(delta, out=delta), 0.0, out=delta)
+
+    # Use EWM for smoothing (Wilder's method)
+    avg_gains = pd.Series(gains).ewm(span=window, adjust=False).mean().to_numpy()
+    avg_losses = pd.Series(losses).ewm(span=window, adjust=False).mean().to_numpy()
+
+    # No losses in the average: RSI is 100 (set directly, not via NaN + fillna)
+    no_losses = avg_losses == 0
+    rs = np.divide(avg_gains, avg_losses, out=np.zeros_like(avg_gains), where=~no_losses)
+    rsi = 100.0 - (100.0 / (1.0 + rs))
+    rsi[no_losses] = 100.0
+
+    return pd.Series(rsi, index=prices.index, name=prices.name)
+
+
+class IndicatorCache:
+    """
+    Lazily computed, memoized indicators over one OHLCV DataFrame.
+
+    Usage:
+        indicators = IndicatorCache(data)
+        indicators.sma(20)  # computed
+        indicators.sma(20)  # memoized
+
+    NOTE: Returned Series are shared between callers; treat them as read-only.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Args:
+            data: DataFrame with OHLCV data; must not be mutated while cached
+        """
+        self.data = data
+        self._cache: Dict[Hashable, Union[pd.Series, np.ndarray]] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        compute: Callable[[], Union[pd.Series, np.ndarray]]
+    ) -> Union[pd.Series, np.ndarray]:
+        """Return the cached value for key, computing it on first use."""
+        value = self._cache.get(key)
+        if value is None:
+            value = compute()
+            self._cache[key] = value
+        return value
+
+    def close_values(self) -> np.ndarray:
+        """
+        Close as a contiguous float64 ndarray, extracted once per cache.
+
+        WHY: Strategies and the rolling kernel all need the raw closes; each
+        data['Close'] goes through DataFrame indexing and builds a new Series.
+        Kept here rather than in data.attrs because pandas deep-copies attrs
+        into every derived Series and frame.
+
+        NOTE: Like every value here, this is a snapshot of data when first
+        requested. Backtester only keeps a cache for one
+        run_multiple_strategies call, never across run() calls.
+        """
+        return self.get(
+            'close',
+            lambda: as_kernel_array(self.data['Close'].to_numpy(dtype=np.float64))
+        )
+
+    def sma(self, window: int) -> pd.Series:
+        """Simple moving average of Close (NaN until a full window)."""
+        if self._use_kernel(window):
+            return self._mean_std(window)[0]
+        return self.get(
+            ('sma', window),
+            lambda: self.data['Close'].rolling(window=window, min_periods=window).mean()
+        )
+
+    def rolling_std(self, window: int) -> pd.Series:
+        """Rolling sample standard deviation of Close (NaN until a full window)."""
+        if self._use_kernel(window):
+            return self._mean_std(window)[1]
+        return self.get(
+            ('std', window),
+            lambda: self.data['Close'].rolling(window=window, min_periods=window).std()
+        )
+
+    @staticmethod
+    def _use_kernel(window: int) -> bool:
+        """Whether the compiled kernel applies (other windows get pandas' errors)."""
+        return (
+            _rolling_mean_std is not None
+            and isinstance(window, (int, np.integer))
+            and not isinstance(window, bool)
+            and window >= 1
+        )
+
+    def _mean_std(self, window: int) -> Tuple[pd.Series, pd.Series]:
+        """Rolling mean and std of Close from one kernel pass, cached together."""
+        key_mean, key_std = ('sma', window), ('std', window)
+        if key_mean not in self._cache or key_std not in self._cache:
+            mean, std = _rolling_mean_std(self.close_values(), int(window))
+            index = self.data.index
+            self._cache[key_mean] = pd.Series(mean, index=index, name='Close')
+            self._cache[key_std] = pd.Series(std, index=index, name='Close')
+        return self._cache[key_mean], self._cache[key_std]
+
+    def rsi(self, window: int) -> pd.Series:
+        """RSI of Close (see calculate_rsi)."""
+        return self.get(('rsi', window), lambda: calculate_rsi(self.data['Close'], window))
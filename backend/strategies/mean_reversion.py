@@ -9,6 +9,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .base_strategy import BaseStrategy
+from .indicators import IndicatorCache
 
 
 class MeanReversionStrategy(BaseStrategy):
@@ -43,16 +44,21 @@ class MeanReversionStrategy(BaseStrategy):
             raise ValueError(f"num_std must be positive number, got {num_std}")
 
         if window < 10:
-            print(f"Warning: window={window} is small, bands may be noisy")
+            self._warn(f"window={window} is small, bands may be noisy")
 
         if num_std < 1.5 or num_std > 3.0:
-            print(f"Warning: num_std={num_std} is unusual (typical: 1.5-3.0)")
+            self._warn(f"num_std={num_std} is unusual (typical: 1.5-3.0)")
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate signals based on Bollinger Band touches."""
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0.0
-
+        return self.generate_signals_prepared(data, IndicatorCache(data))
+
+    def generate_signals_prepared(
+        self,
+        data: pd.DataFrame,
+        prepared: IndicatorCache
+    ) -> pd.DataFrame:
+        """Same as generate_signals(), reusing indicators from prepared."""
         if len(data) < self.parameters['window']:
             raise ValueError(
                 f"Insufficient data: need at least {self.parameters['window']} bars, "
@@ -60,64 +66,41 @@ class MeanReversionStrategy(BaseStrategy):
             )
 
         # Calculate Bollinger Bands
-        signals['middle_band'] = data['Close'].rolling(
-            window=self.parameters['window'],
-            min_periods=self.parameters['window']
-        ).mean()
-
-        signals['std'] = data['Close'].rolling(
-            window=self.parameters['window'],
-            min_periods=self.parameters['window']
-        ).std()
-
-        signals['upper_band'] = signals['middle_band'] + (
-            self.parameters['num_std'] * signals['std']
-        )
-        signals['lower_band'] = signals['middle_band'] - (
-            self.parameters['num_std'] * signals['std']
+        # WHY: Bands and signals stay plain arrays; only the two returned
+        # columns are ever put in a DataFrame, built once at the end.
+        middle_band = prepared.sma(self.parameters['window']).to_numpy(dtype=np.float64)
+        std = prepared.rolling_std(self.parameters['window']).to_numpy(dtype=np.float64)
+
+        price = prepared.close_values()
+        upper = middle_band + self.parameters['num_std'] * std
+        lower = middle_band - self.parameters['num_std'] * std
+
+        # Band crosses (discrete events), vectorized over the bars
+        # WHY: Comparing each bar against the previous close as whole arrays
+        # replaces a per-row .iloc loop. NaN bands (warm-up window) never
+        # signal; a bar can't cross both bands at once.
+        prev_price = price[:-1]
+        current_price = price[1:]
+        has_bands = ~(np.isnan(lower[1:]) | np.isnan(upper[1:]))
+        buy = has_bands & (prev_price >= lower[1:]) & (current_price < lower[1:])
+        sell = has_bands & (prev_price <= upper[1:]) & (current_price > upper[1:])
+
+        # WHY int8: signals only hold -1/0/1; an eighth of the float64 footprint
+        signal = np.zeros(len(price), dtype=np.int8)
+        signal[1:] = np.where(buy, 1, np.where(sell, -1, 0))
+
+        # Maintain position state between signals: long after a buy, flat after a sell
+        return pd.DataFrame(
+            {'signal': signal, 'position_raw': self._long_only_state(signal)},
+            index=data.index, copy=False
         )
 
-        signals['price'] = data['Close']
-
-        # Use loop for precise crossover detection (band touches are discrete events)
-        for i in range(1, len(signals)):
-            current_price = signals['price'].iloc[i]
-            prev_price = signals['price'].iloc[i-1]
-            lower = signals['lower_band'].iloc[i]
-            upper = signals['upper_band'].iloc[i]
-            middle = signals['middle_band'].iloc[i]
-
-            if pd.isna(lower) or pd.isna(upper):
-                continue
-
-            if prev_price >= lower and current_price < lower:
-                signals.iloc[i, signals.columns.get_loc('signal')] = 1.0
-
-            elif prev_price <= upper and current_price > upper:
-                signals.iloc[i, signals.columns.get_loc('signal')] = -1.0
-
-            elif abs(current_price - middle) < signals['std'].iloc[i] * 0.5:
-                pass
-
-        # Maintain position state between signals
-        signals['position_raw'] = 0.0
-        position = 0.0
-        for i in range(len(signals)):
-            if signals['signal'].iloc[i] == 1.0:
-                position = 1.0
-            elif signals['signal'].iloc[i] == -1.0:
-                position = 0.0
-            signals.iloc[i, signals.columns.get_loc('position_raw')] = position
-
-        return signals[['signal', 'position_raw']]
-
     def calculate_positions(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Convert signals to positions, shifted to avoid look-ahead bias."""
-        positions = pd.DataFrame(index=signals.index)
-        positions['position'] = signals['position_raw']
         # Shift by 1: can't act on band touch until next period
-        positions['position'] = positions['position'].shift(1).fillna(0)
-        return positions
+        return self._lag_positions(
+            signals['position_raw'].to_numpy(dtype=np.float64), signals.index
+        )
 
     def get_parameter_info(self) -> Dict[str, Any]:
         """Return strategy metadata for API documentation."""
@@ -9,6 +9,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .base_strategy import BaseStrategy
+from .indicators import IndicatorCache, calculate_rsi
 
 
 class MomentumStrategy(BaseStrategy):
@@ -54,9 +55,9 @@ class MomentumStrategy(BaseStrategy):
             )
 
         if window < 7:
-            print(f"Warning: window={window} is small, RSI may be noisy")
+            self._warn(f"window={window} is small, RSI may be noisy")
         if window > 28:
-            print(f"Warning: window={window} is large, RSI may be laggy")
+            self._warn(f"window={window} is large, RSI may be laggy")
 
     def _calculate_rsi(self, prices: pd.Series, window: int) -> pd.Series:
         """
@@ -69,25 +70,18 @@ class MomentumStrategy(BaseStrategy):
         Returns:
             Series of RSI values (0-100)
         """
-        delta = prices.diff()
-        gains = delta.where(delta > 0, 0.0)
-        losses = -delta.where(delta < 0, 0.0)
-
-        # Use EWM for smoothing (Wilder's method)
-        avg_gains = gains.ewm(span=window, adjust=False).mean()
-        avg_losses = losses.ewm(span=window, adjust=False).mean()
-
-        rs = avg_gains / avg_losses
-        rsi = 100.0 - (100.0 / (1.0 + rs))
-        rsi = rsi.fillna(100.0)
-
-        return rsi
+        return calculate_rsi(prices, window)
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate signals based on RSI crossovers."""
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0.0
-
+        return self.generate_signals_prepared(data, IndicatorCache(data))
+
+    def generate_signals_prepared(
+        self,
+        data: pd.DataFrame,
+        prepared: IndicatorCache
+    ) -> pd.DataFrame:
+        """Same as generate_signals(), reusing indicators from prepared."""
         if len(data) < self.parameters['window'] + 1:
             raise ValueError(
                 f"Insufficient data: need at least {self.parameters['window'] + 1} bars, "
@@ -95,47 +89,37 @@ class MomentumStrategy(BaseStrategy):
             )
 
         # Calculate RSI
-        signals['rsi'] = self._calculate_rsi(
-            data['Close'],
-            self.parameters['window']
-        )
+        rsi = prepared.rsi(self.parameters['window']).to_numpy(dtype=np.float64)
 
         oversold = self.parameters['oversold']
         overbought = self.parameters['overbought']
 
-        # Signal on threshold crossovers (not continuous levels)
-        for i in range(1, len(signals)):
-            current_rsi = signals['rsi'].iloc[i]
-            prev_rsi = signals['rsi'].iloc[i-1]
-
-            if pd.isna(current_rsi) or pd.isna(prev_rsi):
-                continue
-
-            if prev_rsi <= oversold and current_rsi > oversold:
-                signals.iloc[i, signals.columns.get_loc('signal')] = 1.0
-
-            elif prev_rsi >= overbought and current_rsi < overbought:
-                signals.iloc[i, signals.columns.get_loc('signal')] = -1.0
-
-        # Maintain position state between signals
-        signals['position_raw'] = 0.0
-        position = 0.0
-        for i in range(len(signals)):
-            if signals['signal'].iloc[i] == 1.0:
-                position = 1.0
-            elif signals['signal'].iloc[i] == -1.0:
-                position = 0.0
-            signals.iloc[i, signals.columns.get_loc('position_raw')] = position
-
-        return signals[['signal', 'position_raw']]
+        # Signal on threshold crossovers (not continuous levels), vectorized
+        # WHY: Comparing each bar's RSI against the previous one as whole
+        # arrays replaces a per-row .iloc loop. Comparisons against NaN are
+        # False, so undefined RSI values never signal; oversold < overbought
+        # means a bar can't cross both thresholds at once.
+        prev_rsi = rsi[:-1]
+        current_rsi = rsi[1:]
+        buy = (prev_rsi <= oversold) & (current_rsi > oversold)
+        sell = (prev_rsi >= overbought) & (current_rsi < overbought)
+
+        # WHY int8: signals only hold -1/0/1; an eighth of the float64 footprint
+        signal = np.zeros(len(rsi), dtype=np.int8)
+        signal[1:] = np.where(buy, 1, np.where(sell, -1, 0))
+
+        # Maintain position state between signals: long after a buy, flat after a sell
+        return pd.DataFrame(
+            {'signal': signal, 'position_raw': self._long_only_state(signal)},
+            index=data.index, copy=False
+        )
 
     def calculate_positions(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Convert signals to positions, shifted to avoid look-ahead bias."""
-        positions = pd.DataFrame(index=signals.index)
-        positions['position'] = signals['position_raw']
         # Shift by 1: can't act on RSI calculation until next period
-        positions['position'] = positions['position'].shift(1).fillna(0)
-        return positions
+        return self._lag_positions(
+            signals['position_raw'].to_numpy(dtype=np.float64), signals.index
+        )
 
     def get_parameter_info(self) -> Dict[str, Any]:
         """Return strategy metadata for API documentation."""
@@ -9,6 +9,7 @@ from typing import Dict, Any
 import pandas as pd
 import numpy as np
 from .base_strategy import BaseStrategy
+from .indicators import IndicatorCache
 
 
 class MovingAverageStrategy(BaseStrategy):
@@ -49,15 +50,20 @@ class MovingAverageStrategy(BaseStrategy):
 
         # Warn if parameters are unusual (not an error, but might indicate mistake)
         if fast < 5:
-            print(f"Warning: fast_window={fast} is very small, may be noisy")
+            self._warn(f"fast_window={fast} is very small, may be noisy")
         if slow > 200:
-            print(f"Warning: slow_window={slow} is very large, may be laggy")
+            self._warn(f"slow_window={slow} is very large, may be laggy")
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
         """Generate buy/sell signals based on MA crossover."""
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0.0
-
+        return self.generate_signals_prepared(data, IndicatorCache(data))
+
+    def generate_signals_prepared(
+        self,
+        data: pd.DataFrame,
+        prepared: IndicatorCache
+    ) -> pd.DataFrame:
+        """Same as generate_signals(), reusing indicators from prepared."""
         if len(data) < self.parameters['slow_window']:
             raise ValueError(
                 f"Insufficient data: need at least {self.parameters['slow_window']} bars, "
@@ -65,36 +71,28 @@ class MovingAverageStrategy(BaseStrategy):
             )
 
         # Calculate moving averages
-        signals['fast_ma'] = data['Close'].rolling(
-            window=self.parameters['fast_window'],
-            min_periods=self.parameters['fast_window']
-        ).mean()
-
-        signals['slow_ma'] = data['Close'].rolling(
-            window=self.parameters['slow_window'],
-            min_periods=self.parameters['slow_window']
-        ).mean()
-
-        # Use np.where for vectorized comparison (faster than iterating)
-        signals['position_raw'] = np.where(
-            signals['fast_ma'] > signals['slow_ma'],
-            1.0,
-            0.0
-        )
+        fast_ma = prepared.sma(self.parameters['fast_window']).to_numpy(dtype=np.float64)
+        slow_ma = prepared.sma(self.parameters['slow_window']).to_numpy(dtype=np.float64)
 
-        # Use diff() to generate signals only at crossover points
-        signals['signal'] = signals['position_raw'].diff()
-        signals['signal'].iloc[0] = 0.0
+        # Vectorized comparison (faster than iterating); state and signals
+        # only hold -1/0/1, so int8 is enough
+        position_raw = (fast_ma > slow_ma).astype(np.int8)
 
-        return signals[['signal', 'position_raw']]
+        # Signals only at crossover points: the bar-to-bar change in state
+        signal = np.zeros(len(position_raw), dtype=np.int8)
+        signal[1:] = np.diff(position_raw)
+
+        return pd.DataFrame(
+            {'signal': signal, 'position_raw': position_raw},
+            index=data.index, copy=False
+        )
 
     def calculate_positions(self, signals: pd.DataFrame) -> pd.DataFrame:
         """Convert signals to positions, shifted to avoid look-ahead bias."""
-        positions = pd.DataFrame(index=signals.index)
-        positions['position'] = signals['position_raw']
         # Shift by 1 period: can't trade on today's close until tomorrow
-        positions['position'] = positions['position'].shift(1).fillna(0)
-        return positions
+        return self._lag_positions(
+            signals['position_raw'].to_numpy(dtype=np.float64), signals.index
+        )
 
     def get_parameter_info(self) -> Dict[str, Any]:
         """Return strategy metadata for API documentation."""
@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures.
+
+Run from the backend directory:
+    pip install -r requirements-dev.txt
+    python -m pytest
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Tests import modules the way app.py does, relative to the backend directory
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def make_ohlcv(bars: int = 500, seed: int = 7, start: str = '2020-01-01') -> pd.DataFrame:
+    """Random-walk OHLCV frame on business days, reproducible for a given seed."""
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.cumprod(1.0 + rng.normal(0.0003, 0.015, bars))
+    spread = np.abs(rng.normal(0.0, 0.005, bars)) * close
+    return pd.DataFrame(
+        {
+            'Open': close + rng.normal(0.0, 0.002, bars) * close,
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': rng.integers(1_000_000, 5_000_000, bars).astype(np.float64),
+        },
+        index=pd.bdate_range(start, periods=bars)
+    )
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    """500 bars of synthetic market data."""
+    return make_ohlcv()
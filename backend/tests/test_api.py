@@ -0,0 +1,82 @@
+"""
+API responses compared against the original implementation.
+
+fixtures/baseline_responses.json was recorded by running the same requests
+through app.py at the repository's first commit, over the bundled static
+data (AAPL/SPY, 2020-01-01 to 2024-12-01: the only range that version
+served from static files rather than per-process random data).
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+import app as api
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'baseline_responses.json')
+
+with open(FIXTURE_PATH) as f:
+    BASELINE = json.load(f)
+
+
+@pytest.fixture
+def client():
+    with api._RESULT_CACHE_LOCK:
+        api._RESULT_CACHE.clear()
+    return api.app.test_client()
+
+
+def _assert_matches_baseline(actual, expected):
+    # The equity curve is now rounded to cents before encoding
+    if 'equity_curve' in expected:
+        np.testing.assert_allclose(
+            actual['equity_curve'], expected['equity_curve'], rtol=0, atol=0.005
+        )
+    assert {k: v for k, v in actual.items() if k != 'equity_curve'} == \
+        {k: v for k, v in expected.items() if k != 'equity_curve'}
+
+
+@pytest.mark.parametrize('name', sorted(BASELINE['backtest']))
+def test_backtest_matches_baseline(client, name):
+    case = BASELINE['backtest'][name]
+
+    response = client.post('/api/backtest', json=case['request'])
+
+    assert response.status_code == case['status']
+    _assert_matches_baseline(response.get_json(), case['response'])
+
+
+def test_cached_backtest_matches_baseline(client):
+    case = BASELINE['backtest']['momentum']
+    client.post('/api/backtest', json=case['request'])
+
+    response = client.post('/api/backtest', json=case['request'])
+
+    assert response.status_code == 200
+    _assert_matches_baseline(response.get_json(), case['response'])
+
+
+
+def test_cache_keeps_int_and_float_parameters_apart(client):
+    request = {
+        'strategy': 'mean_reversion', 'ticker': 'AAPL',
+        'start_date': '2020-01-01', 'end_date': '2024-12-01',
+    }
+    as_float = {**request, 'parameters': {'window': 20.0}}
+    uncached = client.post('/api/backtest', json=as_float)
+    with api._RESULT_CACHE_LOCK:
+        api._RESULT_CACHE.clear()
+
+    assert client.post('/api/backtest', json={**request, 'parameters': {'window': 20}}).status_code == 200
+    response = client.post('/api/backtest', json=as_float)
+
+    assert response.status_code == uncached.status_code
+    assert response.get_json() == uncached.get_json()
+
+def test_strategies_match_baseline(client):
+    response = client.get('/api/strategies')
+
+    assert response.status_code == BASELINE['strategies']['status']
+    assert response.get_json() == BASELINE['strategies']['response']
@@ -0,0 +1,202 @@
+"""Backtester behaviour: loop kernel parity, cache scoping on mutated input."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine import backtester as backtester_module
+from engine.backtester import Backtester
+from strategies.base_strategy import BaseStrategy
+from strategies.mean_reversion import MeanReversionStrategy
+from strategies.momentum import MomentumStrategy
+from strategies.moving_average import MovingAverageStrategy
+
+STRATEGIES = [MovingAverageStrategy, MeanReversionStrategy, MomentumStrategy]
+
+# Ways of running steps 3-6: compiled kernel, the same kernel as plain
+# Python, and the NumPy fallback used when Numba isn't installed
+LOOP_IMPLEMENTATIONS = [
+    pytest.param(
+        backtester_module._run_kernel, id='numba',
+        marks=pytest.mark.skipif(backtester_module._run_kernel is None, reason='numba not installed')
+    ),
+    pytest.param(backtester_module._run_kernel_py, id='python'),
+    pytest.param(None, id='numpy'),
+]
+
+
+class LegacyStrategy(BaseStrategy):
+    """Strategy written against the original interface: generate_signals(data) only."""
+
+    def validate_parameters(self) -> None:
+        pass
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        # Long, flat and short spells, including a trade still open at the end
+        pattern = np.array([0, 1, 1, 1, 0, 0, -1, -1, 0, 1, 1, 0, -1, 1, 1])
+        return pd.DataFrame({'signal': np.resize(pattern, len(data))}, index=data.index)
+
+    def calculate_positions(self, signals: pd.DataFrame) -> pd.DataFrame:
+        # Hold exactly the signalled position, so it returns to flat
+        return pd.DataFrame({'position': signals['signal'].shift(1).fillna(0)})
+
+    def get_parameter_info(self):
+        return {}
+
+
+def _assert_same_results(actual, expected):
+    np.testing.assert_array_equal(actual['equity_curve'], expected['equity_curve'])
+    np.testing.assert_array_equal(actual['positions'], expected['positions'])
+    np.testing.assert_array_equal(actual['returns'], expected['returns'])
+    assert actual['trades'] == expected['trades']
+
+
+def _baseline_equity(data, positions, initial_capital):
+    """Returns and equity computed the way the original pandas engine did."""
+    # Same as the original pct_change().fillna(0), whose default pads NaN
+    # closes; spelled out because pandas deprecates that implicit fill
+    returns = data['Close'].ffill().pct_change(fill_method=None).fillna(0)
+    strategy_returns = positions * returns
+    return strategy_returns, initial_capital * (1 + strategy_returns).cumprod()
+
+
+@pytest.mark.parametrize('strategy_class', STRATEGIES + [LegacyStrategy])
+@pytest.mark.parametrize('run_kernel', LOOP_IMPLEMENTATIONS)
+def test_loop_matches_pandas(monkeypatch, ohlcv, strategy_class, run_kernel):
+    reference = Backtester().run(strategy_class(), ohlcv)
+    monkeypatch.setattr(backtester_module, '_run_kernel', run_kernel)
+
+    results = Backtester().run(strategy_class(), ohlcv)
+
+    positions = pd.Series(results['positions'], index=ohlcv.index)
+    strategy_returns, equity = _baseline_equity(ohlcv, positions, 100000.0)
+    np.testing.assert_array_equal(results['returns'], strategy_returns.to_numpy())
+    np.testing.assert_array_equal(results['equity_curve'], equity.to_numpy())
+    _assert_same_results(results, reference)
+
+
+@pytest.mark.parametrize('strategy_class', STRATEGIES + [LegacyStrategy])
+@pytest.mark.parametrize('run_kernel', LOOP_IMPLEMENTATIONS)
+def test_loop_matches_pandas_over_nan_closes(monkeypatch, ohlcv, strategy_class, run_kernel):
+    """Missing closes (including the first bar) don't poison later equity."""
+    gaps = ohlcv.copy()
+    gaps.iloc[[0, 150, 151, 320], gaps.columns.get_loc('Close')] = np.nan
+    monkeypatch.setattr(backtester_module, '_run_kernel', run_kernel)
+
+    results = Backtester().run(strategy_class(), gaps)
+
+    positions = pd.Series(results['positions'], index=gaps.index)
+    strategy_returns, equity = _baseline_equity(gaps, positions, 100000.0)
+    assert np.isfinite(results['equity_curve']).all()
+    np.testing.assert_array_equal(results['returns'], strategy_returns.to_numpy())
+    np.testing.assert_array_equal(results['equity_curve'], equity.to_numpy())
+
+
+@pytest.mark.parametrize('run_kernel', LOOP_IMPLEMENTATIONS)
+def test_loop_matches_pandas_over_zero_closes(monkeypatch, ohlcv, run_kernel):
+    """A zero close gives pandas' inf / 0/0 returns rather than raising."""
+    zeros = ohlcv.copy()
+    zeros.iloc[[100, 101, 200], zeros.columns.get_loc('Close')] = 0.0
+    monkeypatch.setattr(backtester_module, '_run_kernel', run_kernel)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        results = Backtester().run(LegacyStrategy(), zeros)
+        expected = zeros['Close'].pct_change(fill_method=None).fillna(0).to_numpy()
+        np.testing.assert_array_equal(results['returns'], results['positions'] * expected)
+
+
+@pytest.mark.parametrize('run_kernel', LOOP_IMPLEMENTATIONS)
+def test_trades_from_position_changes(monkeypatch, ohlcv, run_kernel):
+    monkeypatch.setattr(backtester_module, '_run_kernel', run_kernel)
+
+    trades = Backtester().run(LegacyStrategy(), ohlcv.iloc[:60])['trades']
+
+    close = ohlcv['Close'].to_numpy()
+    assert [(t['entry_date'], t['direction'], t['exit_date']) for t in trades[:4]] == [
+        ('2020-01-03', 'long', '2020-01-08'),
+        ('2020-01-10', 'short', '2020-01-14'),
+        ('2020-01-15', 'long', '2020-01-17'),
+        ('2020-01-20', 'short', '2020-01-23'),  # Flips short -> long without going flat
+    ]
+    assert (trades[1]['entry_price'], trades[1]['exit_price']) == (close[7], close[9])
+    assert trades[1]['pnl_percent'] == pytest.approx((close[7] - close[9]) / close[7] * 100)
+    # Four round trips per 15-bar cycle; the trade still open on the last bar is not reported
+    assert len(trades) == 15
+
+
+def test_legacy_strategy_runs_alone_and_shared(ohlcv):
+    """Subclasses implementing only generate_signals(data) work with a shared cache."""
+    backtester = Backtester()
+    strategies = [('legacy', LegacyStrategy()), ('ma', MovingAverageStrategy())]
+
+    results = backtester.run_multiple_strategies(strategies, ohlcv)
+
+    for name, strategy in strategies:
+        _assert_same_results(results[name], backtester.run(strategy, ohlcv))
+    assert results['legacy']['trades']
+
+
+@pytest.mark.skipif(
+    not hasattr(backtester_module._run_kernel, 'signatures'), reason='numba JIT not active'
+)
+def test_archive_data_reuses_warmed_up_kernels(tmp_path, ohlcv):
+    """Read-only, strided archive columns don't compile new kernel specializations."""
+    from numba import types
+
+    from data.data_handler import StaticDataArchive, write_static_archive
+    from engine import _perf_kernels
+    from engine.performance import generate_performance_report
+    from strategies import indicators
+
+    write_static_archive(str(tmp_path), {'AAA': ohlcv})
+    first, last = ohlcv.index[[0, -1]].strftime('%Y-%m-%d')
+    data = StaticDataArchive(str(tmp_path)).get('AAA', first, last)
+    assert not data['Close'].to_numpy().flags.writeable
+    backtester_module.warm_up()
+
+    for strategy_class in STRATEGIES:
+        results = Backtester().run(strategy_class(), data)
+        generate_performance_report(
+            results['equity_curve'], results['returns'], results['trades'], 100000.0
+        )
+
+    kernels = [
+        backtester_module._run_kernel, indicators._rolling_mean_std,
+        indicators._rsi, _perf_kernels._all_metrics
+    ]
+    for kernel in kernels:
+        for signature in kernel.signatures:
+            arrays = [arg for arg in signature if isinstance(arg, types.Array)]
+            assert all(a.layout == 'C' and a.mutable for a in arrays), (kernel, signature)
+
+
+def test_run_sees_close_mutated_in_place(ohlcv):
+    """A second run() on the same frame reflects an in-place change to Close."""
+    backtester = Backtester()
+    mutated = ohlcv.copy()
+
+    for strategy_class in STRATEGIES:
+        mutated['Close'] = ohlcv['Close']
+        backtester.run(strategy_class(), mutated)
+
+        mutated.loc[mutated.index[200:], 'Close'] *= 1.5
+        fresh = mutated.copy()
+
+        _assert_same_results(
+            backtester.run(strategy_class(), mutated),
+            backtester.run(strategy_class(), fresh)
+        )
+
+
+def test_run_multiple_strategies_sees_mutation_between_calls(ohlcv):
+    """Indicators shared inside one call are not reused by the next call."""
+    backtester = Backtester()
+    strategies = [(cls.__name__, cls()) for cls in STRATEGIES]
+    mutated = ohlcv.copy()
+
+    backtester.run_multiple_strategies(strategies, mutated)
+    mutated['Close'] = mutated['Close'].to_numpy()[::-1]
+
+    after = backtester.run_multiple_strategies(strategies, mutated)
+    for name, strategy in strategies:
+        _assert_same_results(after[name], backtester.run(strategy, mutated.copy()))
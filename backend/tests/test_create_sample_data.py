@@ -0,0 +1,41 @@
+"""create_sample_data: vectorized price generation."""
+
+import numpy as np
+import pytest
+
+from create_sample_data import DEMO_STOCKS, generate_realistic_stock_data
+from data.data_handler import ticker_seed
+
+
+def _loop_close(ticker: str, start_price: float, volatility: float, trend: float, n_days: int):
+    """Closes from the original day-by-day compounding loop, on the same draws."""
+    noise = np.random.default_rng(ticker_seed(ticker)).standard_normal((4, n_days))
+    segment_length = n_days // 6
+
+    price_series = np.zeros(n_days)
+    price_series[0] = start_price
+    for i in range(1, n_days):
+        current_trend = trend if (i // segment_length) % 2 == 0 else -trend * 0.3
+        daily_return = current_trend / 252 + volatility * noise[0, i]
+        price_series[i] = price_series[i - 1] * (1 + daily_return)
+    return price_series
+
+
+@pytest.mark.parametrize('ticker', sorted(DEMO_STOCKS))
+def test_cumprod_matches_compounding_loop(ticker):
+    data = generate_realistic_stock_data(ticker, **DEMO_STOCKS[ticker])
+
+    expected = _loop_close(ticker, n_days=len(data), **DEMO_STOCKS[ticker])
+
+    assert data['Close'].iloc[0] == DEMO_STOCKS[ticker]['start_price']
+    # Close is rounded to cents; cumprod only reassociates the products
+    np.testing.assert_allclose(data['Close'], expected, rtol=0, atol=0.005 + 1e-9)
+
+
+def test_generation_is_reproducible_and_consistent():
+    first = generate_realistic_stock_data('AAPL', **DEMO_STOCKS['AAPL'])
+    second = generate_realistic_stock_data('AAPL', **DEMO_STOCKS['AAPL'])
+
+    assert first.equals(second)
+    assert (first['High'] >= first[['Open', 'Close']].max(axis=1)).all()
+    assert (first['Low'] <= first[['Open', 'Close']].min(axis=1)).all()
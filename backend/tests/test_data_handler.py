@@ -0,0 +1,188 @@
+"""DataHandler: date handling, static archive and on-disk cache."""
+
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.data_handler import (
+    DataHandler, StaticDataArchive, _business_days, _narrow_column, write_static_archive
+)
+
+
+@pytest.fixture
+def generating_handler(tmp_path) -> DataHandler:
+    """Handler with no static data, so every request is generated."""
+    return DataHandler(cache_dir=str(tmp_path / 'cache'), static_data_dir=str(tmp_path / 'none'))
+
+
+@pytest.mark.parametrize('start_date, end_date', [
+    ('2020-01-01', '2024-12-01'),
+    ('2019-9-9', '2020-1-3'),
+    ('2021-02-27', '2021-03-02'),  # Starts on a weekend
+    ('2021-03-06', '2021-03-07'),  # Weekend only
+])
+def test_business_days_match_pandas(start_date, end_date):
+    expected = pd.date_range(start_date, end_date, freq='B')
+    assert _business_days(start_date, end_date).equals(expected)
+
+
+def test_generates_data_for_unpadded_dates(generating_handler):
+    """Dates validate_date_range accepts must also load."""
+    generating_handler.validate_date_range('2019-9-9', '2020-1-3')
+
+    data = generating_handler.get_data('ZZZ', '2019-9-9', '2020-1-3', use_cache=False)
+
+    assert data.index[0] == pd.Timestamp('2019-09-09')
+    assert data.index[-1] == pd.Timestamp('2020-01-03')
+    pd.testing.assert_frame_equal(
+        data, generating_handler.get_data('ZZZ', '2019-09-09', '2020-01-03', use_cache=False)
+    )
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    """Static archive with one ticker over January 2020 (business days)."""
+    index = pd.bdate_range('2020-01-01', '2020-01-31')
+    frame = pd.DataFrame(
+        {
+            'Open': np.arange(len(index), dtype=np.float64) + 100.0,
+            'High': np.arange(len(index), dtype=np.float64) + 101.0,
+            'Low': np.arange(len(index), dtype=np.float64) + 99.0,
+            'Close': np.arange(len(index), dtype=np.float64) + 100.5,
+            'Volume': np.arange(len(index), dtype=np.int64) * 1000,
+        },
+        index=index
+    )
+    write_static_archive(str(tmp_path), {'AAA': frame})
+    return tmp_path
+
+
+@pytest.mark.parametrize('start_date, end_date, first, last', [
+    ('2020-01-01', '2020-01-31', '2020-01-01', '2020-01-31'),  # Full range
+    ('2020-1-1', '2020-1-31', '2020-01-01', '2020-01-31'),      # Not zero-padded
+    ('2020-01-06', '2020-01-10', '2020-01-06', '2020-01-10'),  # Inclusive ends
+    ('2020-01-04', '2020-01-12', '2020-01-06', '2020-01-10'),  # Ends on weekends
+    ('2020-01-31', '2020-01-31', '2020-01-31', '2020-01-31'),  # Single day
+    ('2020-01-27', '2020-02-02', '2020-01-27', '2020-01-31'),  # Weekend after the last row
+])
+def test_archive_get_slices_inclusive_range(archive_dir, start_date, end_date, first, last):
+    data = StaticDataArchive(str(archive_dir)).get('AAA', start_date, end_date)
+
+    assert data.index[0] == pd.Timestamp(first)
+    assert data.index[-1] == pd.Timestamp(last)
+    assert list(data.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    assert data['Volume'].dtype == np.int64
+
+
+@pytest.mark.parametrize('ticker, start_date, end_date', [
+    ('BBB', '2020-01-01', '2020-01-31'),   # Not archived
+    ('AAA', '2019-12-31', '2020-01-31'),   # Starts before the archive
+    ('AAA', '2020-01-01', '2020-02-03'),   # Ends after the archive
+    ('AAA', '2020-1-1', '2020-2-3'),       # Same, not zero-padded
+    ('AAA', '2020-01-04', '2020-01-05'),   # Weekend only: no rows
+    ('AAA', '2020-01-10', '2020-01-06'),   # Reversed
+])
+def test_archive_get_misses(archive_dir, ticker, start_date, end_date):
+    assert StaticDataArchive(str(archive_dir)).get(ticker, start_date, end_date) is None
+
+
+def test_archive_records_real_coverage(tmp_path):
+    """A short download (period='5y') can't be served for the range it missed."""
+    index = pd.bdate_range('2020-03-02', '2020-06-30')
+    frame = pd.DataFrame(
+        {column: np.linspace(100.0, 110.0, len(index)) for column in ['Open', 'High', 'Low', 'Close']},
+        index=index
+    )
+    frame['Volume'] = 1000
+    write_static_archive(str(tmp_path), {'AAA': frame})
+    archive = StaticDataArchive(str(tmp_path))
+
+    assert archive.index['AAA']['start_date'] == '2020-03-02'
+    assert archive.index['AAA']['end_date'] == '2020-06-30'
+    assert archive.get('AAA', '2020-01-01', '2020-06-30') is None
+    assert archive.get('AAA', '2020-02-29', '2020-06-30') is not None  # Starts on a Saturday
+
+
+def test_archive_frames_are_read_only(archive_dir):
+    """Mapped pages are shared by every request, so writes must fail."""
+    data = StaticDataArchive(str(archive_dir)).get('AAA', '2020-01-01', '2020-01-31')
+
+    with pytest.raises(ValueError):
+        data['Close'].to_numpy()[0] = 0.0
+
+
+def test_handler_falls_back_to_generation_outside_archive(archive_dir, tmp_path):
+    handler = DataHandler(cache_dir=str(tmp_path / 'cache'), static_data_dir=str(archive_dir))
+
+    archived = handler.get_data('AAA', '2020-1-6', '2020-1-10', use_cache=False)
+    generated = handler.get_data('AAA', '2020-01-01', '2020-02-14', use_cache=False)
+
+    np.testing.assert_array_equal(archived['Close'], [103.5, 104.5, 105.5, 106.5, 107.5])
+    assert len(generated) == len(pd.bdate_range('2020-01-01', '2020-02-14'))
+
+
+def _cache_frame(tz=None) -> pd.DataFrame:
+    index = pd.bdate_range('2021-03-01', periods=6, tz=tz, name='Date')
+    return pd.DataFrame(
+        {
+            'Close': [101.25, 99.5, np.nan, 100.0, 250.01, 65535.99],    # Cents: narrowed
+            'Adj Close': [101.2513, 99.4987, 100.1, 99.9, 249.87, 1e6],  # Not narrowed
+            'Volume': np.array([1, 2, 3, 4, 5, 2**31 - 1], dtype=np.int64),
+            'Big Volume': np.array([1, 2, 3, 4, 5, 2**40], dtype=np.int64),
+        },
+        index=index
+    )
+
+
+@pytest.mark.parametrize('tz', [None, 'America/New_York'])
+def test_cache_round_trip_is_exact(tmp_path, tz):
+    handler = DataHandler(cache_dir=str(tmp_path), static_data_dir=str(tmp_path / 'none'))
+    frame = _cache_frame(tz)
+    path = handler._get_cache_path('AAA', '2021-03-01', '2021-03-08')
+
+    handler._save_to_cache(frame, path)
+    loaded = handler._load_from_cache(path)
+
+    pd.testing.assert_frame_equal(loaded, frame, check_exact=True, check_freq=False)
+    # The cent-priced and int32-range columns really were stored narrowed
+    assert _narrow_column(frame['Close'].to_numpy())[0].dtype == np.float32
+    assert _narrow_column(frame['Volume'].to_numpy())[0].dtype == np.int32
+    assert _narrow_column(frame['Adj Close'].to_numpy())[0].dtype == np.float64
+    assert _narrow_column(frame['Big Volume'].to_numpy())[0].dtype == np.int64
+
+
+def test_cache_round_trip_multiindex_columns(tmp_path):
+    """yfinance.download returns (field, ticker) column tuples."""
+    handler = DataHandler(cache_dir=str(tmp_path), static_data_dir=str(tmp_path / 'none'))
+    frame = _cache_frame()
+    frame.columns = pd.MultiIndex.from_tuples([(name, 'AAA') for name in frame.columns])
+    path = handler._get_cache_path('AAA', '2021-03-01', '2021-03-08')
+
+    handler._save_to_cache(frame, path)
+
+    pd.testing.assert_frame_equal(
+        handler._load_from_cache(path), frame, check_exact=True, check_freq=False
+    )
+
+
+def test_non_numeric_frames_are_not_cached(tmp_path):
+    handler = DataHandler(cache_dir=str(tmp_path), static_data_dir=str(tmp_path / 'none'))
+    frame = _cache_frame()
+    frame['Note'] = 'x'
+    path = handler._get_cache_path('AAA', '2021-03-01', '2021-03-08')
+
+    handler._save_to_cache(frame, path)
+
+    assert not os.path.exists(path)
+
+
+def test_pickled_cache_files_are_not_loaded(tmp_path):
+    handler = DataHandler(cache_dir=str(tmp_path), static_data_dir=str(tmp_path / 'none'))
+    path = handler._get_cache_path('AAA', '2021-03-01', '2021-03-08')
+    with open(path, 'wb') as f:
+        f.write(pickle.dumps(_cache_frame(), protocol=pickle.HIGHEST_PROTOCOL))
+
+    assert handler._load_from_cache(path) is None
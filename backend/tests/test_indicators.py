@@ -0,0 +1,96 @@
+"""Indicator kernels: bit-identical to the pandas rolling / ewm computations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies import indicators
+from strategies.indicators import IndicatorCache, calculate_rsi
+
+from conftest import make_ohlcv
+
+NUMBA = pytest.mark.skipif(indicators._rolling_mean_std is None, reason='numba not installed')
+
+MEAN_STD_KERNELS = [
+    pytest.param(indicators._rolling_mean_std, id='numba', marks=NUMBA),
+    pytest.param(indicators._rolling_mean_std_py, id='python'),
+]
+RSI_KERNELS = [
+    pytest.param(indicators._rsi, id='numba', marks=NUMBA),
+    pytest.param(indicators._rsi_py, id='python'),
+]
+
+
+def _price_series():
+    """Named closes covering a random walk, NaN gaps, a flat run and a short frame."""
+    walk = make_ohlcv(bars=600)['Close']
+
+    gaps = walk.copy()
+    gaps.iloc[[3, 40, 41, 300]] = np.nan
+
+    flat = walk.copy()
+    flat.iloc[100:160] = 123.45  # Constant windows: std exactly 0
+    flat.iloc[400:410] = -1.5    # Negative values
+
+    return {
+        'walk': walk,
+        'gaps': gaps,
+        'flat': flat,
+        'short': walk.iloc[:5],
+        'empty': walk.iloc[:0],
+    }
+
+
+PRICES = _price_series()
+
+
+@pytest.mark.parametrize('window', [1, 2, 5, 20, 50])
+@pytest.mark.parametrize('name', sorted(PRICES))
+@pytest.mark.parametrize('kernel', MEAN_STD_KERNELS)
+def test_rolling_mean_std_matches_pandas(kernel, name, window):
+    prices = PRICES[name]
+
+    mean, std = kernel(prices.to_numpy(), window)
+
+    rolling = prices.rolling(window=window, min_periods=window)
+    np.testing.assert_array_equal(mean, rolling.mean().to_numpy())
+    np.testing.assert_array_equal(std, rolling.std().to_numpy())
+
+
+@pytest.mark.parametrize('window', [2, 7, 14, 28])
+@pytest.mark.parametrize('name', sorted(PRICES))
+@pytest.mark.parametrize('kernel', RSI_KERNELS)
+def test_rsi_matches_pandas(monkeypatch, kernel, name, window):
+    prices = PRICES[name]
+    monkeypatch.setattr(indicators, '_rsi', None)
+    expected = calculate_rsi(prices, window)
+
+    monkeypatch.setattr(indicators, '_rsi', kernel)
+    actual = calculate_rsi(prices, window)
+
+    pd.testing.assert_series_equal(actual, expected, check_exact=True)
+
+
+@pytest.mark.parametrize('window', [20, np.int64(20)])
+def test_indicator_cache_matches_pandas(window):
+    data = make_ohlcv()
+    indicators_ = IndicatorCache(data)
+    rolling = data['Close'].rolling(window=window, min_periods=window)
+
+    pd.testing.assert_series_equal(indicators_.sma(window), rolling.mean(), check_exact=True)
+    pd.testing.assert_series_equal(indicators_.rolling_std(window), rolling.std(), check_exact=True)
+    assert indicators_.sma(window) is indicators_.sma(window)
+
+
+@pytest.mark.parametrize('window', [0, -3, 20.0, True])
+def test_indicator_cache_unusual_windows_behave_like_pandas(window):
+    """Windows the kernel doesn't take go to pandas: same result or same error."""
+    data = make_ohlcv()
+
+    try:
+        expected = data['Close'].rolling(window=window, min_periods=window).mean()
+    except Exception as e:
+        with pytest.raises(type(e)):
+            IndicatorCache(data).sma(window)
+    else:
+        pd.testing.assert_series_equal(IndicatorCache(data).sma(window), expected, check_exact=True)
@@ -0,0 +1,202 @@
+"""Performance metrics: NumPy helpers and the compiled kernel against pandas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine import _perf_kernels, performance
+from engine.performance import PerformanceStats
+
+PPY = 252
+RISK_FREE = 0.02
+
+
+def _returns_cases():
+    rng = np.random.default_rng(0)
+    cases = {}
+    for n in [0, 1, 2, 3, 10, 300, 1283]:
+        returns = rng.normal(0.0005, 0.02, n)
+        returns[:1] = 0.0  # The backtester's first bar
+        cases[f'random_{n}'] = returns
+    cases['flat'] = np.zeros(50)
+    cases['only_gains'] = np.abs(rng.normal(0.0, 0.01, 50))
+    single_loss = np.zeros(50)
+    single_loss[5] = -0.01
+    cases['single_loss'] = single_loss
+    wipeout = rng.normal(0.0, 0.02, 100)
+    wipeout[50:] = -1.0  # Equity hits zero: drawdown over a zero peak
+    cases['wipeout'] = wipeout
+    return cases
+
+
+CASES = _returns_cases()
+
+
+def _pandas_reference(equity: pd.Series, returns: pd.Series, confidence: float = 0.95) -> dict:
+    """Every metric computed with pandas, as the original implementation did."""
+    metrics = dict.fromkeys(PerformanceStats.__dataclass_fields__, 0.0)
+
+    if len(equity) >= 2 and equity.iloc[0] != 0:
+        initial, final = equity.iloc[0], equity.iloc[-1]
+        metrics['total_return'] = (final - initial) / initial * 100.0
+        metrics['annualized_return'] = ((final / initial) ** (PPY / len(equity)) - 1) * 100.0
+    if len(equity) >= 2:
+        running_max = equity.expanding().max()
+        metrics['max_drawdown'] = ((equity - running_max) / running_max).min() * 100.0
+
+    if metrics['max_drawdown'] == 0:
+        metrics['calmar_ratio'] = np.inf if metrics['annualized_return'] > 0 else 0.0
+    else:
+        metrics['calmar_ratio'] = metrics['annualized_return'] / abs(metrics['max_drawdown'])
+
+    if len(returns) >= 2:
+        mean, std = returns.mean(), returns.std()
+        downside = returns[returns < 0]
+        # No losses at all is treated like a zero downside deviation
+        downside_std = downside.std() if len(downside) else 0.0
+        for key, deviation in [('sharpe_ratio', std), ('sortino_ratio', downside_std)]:
+            if deviation == 0:
+                metrics[key] = np.inf if mean > 0 else 0.0
+            else:
+                metrics[key] = (mean * PPY - RISK_FREE) / (deviation * np.sqrt(PPY))
+        metrics['volatility'] = std * np.sqrt(PPY) * 100.0
+        threshold = np.percentile(returns, (1 - confidence) * 100)
+        metrics['var'] = threshold * 100.0
+        metrics['cvar'] = returns[returns <= threshold].mean() * 100.0
+
+    return metrics
+
+
+def _series(name):
+    returns = CASES[name]
+    equity = 100000.0 * np.cumprod(1.0 + returns)
+    return pd.Series(equity), pd.Series(returns)
+
+
+def _assert_metrics_close(actual: dict, expected: dict):
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value, rel=1e-12, abs=1e-12, nan_ok=True), key
+
+
+COMPUTE_ALL = [
+    pytest.param(
+        lambda *args: PerformanceStats(*_perf_kernels._all_metrics(*args)), id='numba',
+        marks=pytest.mark.skipif(_perf_kernels._all_metrics is None, reason='numba not installed')
+    ),
+    pytest.param(lambda *args: PerformanceStats(*_perf_kernels._all_metrics_py(*args)), id='python'),
+    pytest.param(performance._compute_all_numpy, id='numpy'),
+]
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+@pytest.mark.parametrize('compute_all', COMPUTE_ALL)
+def test_compute_all_matches_pandas(compute_all, name):
+    equity, returns = _series(name)
+
+    stats = compute_all(equity.to_numpy(), returns.to_numpy(), RISK_FREE, PPY, 0.95)
+
+    _assert_metrics_close(stats.__dict__, _pandas_reference(equity, returns))
+
+
+NAN_EQUITY = [
+    [100.0, 90.0, np.nan, 80.0, 120.0, 60.0],
+    [np.nan, 100.0, 90.0, np.nan, 120.0, 60.0, 130.0],
+    [np.nan, np.nan, 100.0],
+]
+
+
+def _pandas_max_drawdown(equity: pd.Series) -> float:
+    running_max = equity.expanding().max()
+    return ((equity - running_max) / running_max).min() * 100.0
+
+
+@pytest.mark.parametrize('equity', NAN_EQUITY)
+@pytest.mark.parametrize('compute_all', COMPUTE_ALL)
+def test_max_drawdown_skips_nan_like_pandas(compute_all, equity):
+    stats = compute_all(np.array(equity), np.zeros(0), RISK_FREE, PPY, 0.95)
+
+    assert stats.max_drawdown == pytest.approx(_pandas_max_drawdown(pd.Series(equity)))
+
+
+@pytest.mark.parametrize('equity', NAN_EQUITY)
+def test_calculate_max_drawdown_skips_nan_like_pandas(equity):
+    expected = _pandas_max_drawdown(pd.Series(equity))
+
+    assert performance.calculate_max_drawdown(pd.Series(equity)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_single_metric_functions_match_pandas(name):
+    equity, returns = _series(name)
+
+    actual = {
+        'total_return': performance.calculate_total_return(equity),
+        'annualized_return': performance.calculate_annualized_return(equity),
+        'sharpe_ratio': performance.calculate_sharpe_ratio(returns),
+        'sortino_ratio': performance.calculate_sortino_ratio(returns),
+        'max_drawdown': performance.calculate_max_drawdown(equity),
+        'calmar_ratio': performance.calculate_calmar_ratio(equity),
+        'volatility': performance.calculate_volatility(returns),
+        'var': performance.calculate_var(returns),
+        'cvar': performance.calculate_cvar(returns),
+    }
+
+    _assert_metrics_close(actual, _pandas_reference(equity, returns))
+
+
+@pytest.mark.parametrize('confidence', [1.5, -0.5, np.nan])
+def test_var_rejects_confidence_outside_unit_interval(confidence):
+    returns = CASES['random_300']
+
+    with pytest.raises(ValueError):
+        np.percentile(returns, (1 - confidence) * 100)
+    for metric in (performance.calculate_var, performance.calculate_cvar):
+        with pytest.raises(ValueError, match='confidence'):
+            metric(returns, confidence)
+    with pytest.raises(ValueError, match='confidence'):
+        performance._compute_all(100000.0 * np.cumprod(1 + returns), returns, confidence=confidence)
+
+
+@pytest.mark.parametrize('confidence', [0.0, 1.0])
+def test_var_accepts_confidence_bounds(confidence):
+    returns = CASES['random_300']
+
+    expected = np.percentile(returns, (1 - confidence) * 100) * 100.0
+    assert performance.calculate_var(returns, confidence) == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize('name', ['random_300', 'flat', 'only_gains', 'wipeout'])
+def test_report_is_the_same_with_and_without_kernel(monkeypatch, name):
+    equity, returns = _series(name)
+    pnl = np.random.default_rng(1).normal(0.0, 5.0, 40)
+    trades = [{'pnl_percent': p, 'pnl_dollars': p * 1000} for p in pnl]
+
+    compiled = performance.generate_performance_report(equity, returns, trades, 100000.0)
+    monkeypatch.setattr(performance, '_all_metrics', None)
+    fallback = performance.generate_performance_report(equity, returns, trades, 100000.0)
+
+    assert compiled == fallback
+    assert compiled['trade_metrics']['total_trades'] == 40
+
+
+@pytest.mark.parametrize('trades, expected', [
+    ([], (0.0, 0.0, 0.0, 0.0, 0.0)),
+    ([{'pnl_percent': 2.0, 'pnl_dollars': 2000.0}], (100.0, np.inf, 2.0, 0.0, 0.0)),
+    (
+        [{'pnl_percent': 4.0, 'pnl_dollars': 4000.0},
+         {'pnl_percent': -1.0, 'pnl_dollars': -1000.0},
+         {'pnl_percent': -3.0, 'pnl_dollars': -3000.0},
+         {'pnl_percent': 0.0, 'pnl_dollars': 0.0}],
+        (25.0, 1.0, 4.0, 2.0, 2.0)
+    ),
+])
+def test_trade_metrics(trades, expected):
+    averages = performance.calculate_average_win_loss(trades)
+
+    assert (
+        performance.calculate_win_rate(trades),
+        performance.calculate_profit_factor(trades),
+        averages['avg_win'],
+        averages['avg_loss'],
+        averages['win_loss_ratio'],
+    ) == expected